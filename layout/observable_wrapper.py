@@ -17,7 +17,8 @@ class ObservableWrapper:
     def __setattr__(self, name: str, value: Any) -> None:
         old = getattr(self._target, name, None)
         setattr(self._target, name, value)
-        if old == value:
+        # identity first: avoids a deep == on unchanged containers
+        if old is value or old == value:
             return
 
         # field-specific subscribers
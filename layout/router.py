@@ -11,7 +11,7 @@ from layout.context import PageContext
 from layout.action_bar import ActionBar, Action, EventBus, ACTIONS_BY_ROUTE
 
 from services.app_config import get_app_config
-from services.i18n import t
+from services.i18n import language_scope, t
 
 
 # All pages get (container, ctx) so they can use ctx.bus/action_bar, etc.
@@ -155,7 +155,8 @@ def navigate(ctx: PageContext, route_key: str) -> None:
 
     if ctx.main_area:
         ctx.main_area.clear()
-        route.render(ctx.main_area, ctx)
+        with language_scope():
+            route.render(ctx.main_area, ctx)
 
     if route.on_enter:
         route.on_enter(ctx)
@@ -51,7 +51,7 @@ from services.logging_setup import (
 	log_timing,
 	summarize_for_log,
 )
-from services.i18n import bootstrap_defaults
+from services.i18n import bootstrap_defaults, language_scope
 from services.ui_theme import apply_ui_theme
 
 
@@ -415,8 +415,8 @@ def index():
 		current_id, events = get_error_popup_events_since(last_error_popup_id["value"])
 		last_error_popup_id["value"] = current_id
 		for evt in events:
-			level = str(evt.get("level", "ERROR")).upper()
-			msg = str(evt.get("message", "")).strip()
+			level = evt.level.upper()
+			msg = evt.message
 			if not msg:
 				continue
 			notify_type = "negative" if level in ("ERROR", "CRITICAL") else "warning"
@@ -433,9 +433,10 @@ def index():
 	ui.context.client.on_disconnect(_cleanup_error_popup_watcher)
 
 	# --------- LAYOUT ---------
-	build_header(ctx)
-	build_drawer(ctx)
-	build_device_panel(ctx)
+	with language_scope():
+		build_header(ctx)
+		build_drawer(ctx)
+		build_device_panel(ctx)
 	ctx.dummy_controller.start(ctx)
 
 	with ui.row().classes("w-full").style(
@@ -6,6 +6,7 @@ from nicegui import ui
 
 from layout.context import PageContext
 from services.app_config import get_app_config, save_app_config
+from services.ui_theme import invalidate_theme_cache
 
 
 _HEX_COLOR_RE = re.compile(r"^#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})$")
@@ -110,6 +111,7 @@ def render(container: ui.element, _ctx: PageContext) -> None:
                         cfg_local.ui.theme.palettes[palette_name][key] = raw_value
 
                 save_app_config(cfg_local)
+                invalidate_theme_cache()
                 ui.notify("Color themes saved.", type="positive")
                 ui.run_javascript("location.reload()")
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import string
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
@@ -19,6 +20,18 @@ CONFIG_SETS_DIR = "config/sets"
 ACTIVE_SET_FILE = "config/active_set.json"
 
 _SAFE_NAME_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+_SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+# (mtime_ns of ACTIVE_SET_FILE, active set name); re-read when the file changes.
+_ACTIVE_SET_CACHE: tuple[int, str] | None = None
+
+
+def _active_set_mtime_ns() -> int | None:
+    try:
+        return os.stat(ACTIVE_SET_FILE).st_mtime_ns
+    except OSError:
+        return None
 
 
 def _ensure_config_dirs() -> None:
@@ -28,7 +41,10 @@ def _ensure_config_dirs() -> None:
 
 def _safe_set_name(name: str) -> str:
     name = (name or "").strip()
-    name = _SAFE_NAME_RE.sub("-", name).strip("-")
+    # Names are usually already safe; only run the regex when they are not.
+    if not _SAFE_NAME_CHARS.issuperset(name):
+        name = _SAFE_NAME_RE.sub("-", name)
+    name = name.strip("-")
     return name or "default"
 
 
@@ -40,15 +56,17 @@ def _set_path(set_name: str) -> str:
 def list_config_sets() -> list[str]:
     """Returns list of available config set names (without .json)."""
     _ensure_config_dirs()
-    out: list[str] = []
-    for fn in os.listdir(CONFIG_SETS_DIR):
-        if fn.endswith(".json"):
-            out.append(fn[:-5])
-    return sorted(out)
+    with os.scandir(CONFIG_SETS_DIR) as it:
+        return sorted(e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file())
 
 
 def get_active_set_name() -> str:
     """Returns the currently active set name, creating a default pointer if missing."""
+    global _ACTIVE_SET_CACHE
+    cached = _ACTIVE_SET_CACHE
+    if cached is not None and cached[0] == _active_set_mtime_ns():
+        return cached[1]
+
     _ensure_config_dirs()
 
     if not os.path.exists(ACTIVE_SET_FILE):
@@ -68,15 +86,20 @@ def get_active_set_name() -> str:
         with open(path, "w", encoding="utf-8") as f:
             json.dump({}, f, indent=2)
 
+    mtime_ns = _active_set_mtime_ns()
+    _ACTIVE_SET_CACHE = (mtime_ns, name) if mtime_ns is not None else None
     return name
 
 
 def set_active_set_name(name: str) -> None:
     """Persist the active set pointer."""
+    global _ACTIVE_SET_CACHE
     _ensure_config_dirs()
     name = _safe_set_name(name)
     with open(ACTIVE_SET_FILE, "w", encoding="utf-8") as f:
         json.dump({"active": name}, f, indent=2)
+    mtime_ns = _active_set_mtime_ns()
+    _ACTIVE_SET_CACHE = (mtime_ns, name) if mtime_ns is not None else None
 
 
 def create_config_set(name: str, *, copy_from: str | None = None) -> str:
@@ -218,9 +218,7 @@ class UiApi:
 		- event / events: match by action event
 		"""
 		pat = str(pattern or "").strip() or "view.cmd.*"
-		bus_last = self._ctx.data.get("bus_last", {})
-		if not isinstance(bus_last, dict):
-			return None
+		bus_last = self._ctx.bus_last
 
 		def _normalize_set(single: Optional[str], multi: Optional[list[str]]) -> set[str]:
 			out: set[str] = set()
@@ -361,9 +359,29 @@ class UiApi:
 			pass
 
 	def set_state_many(self, **values: Any) -> None:
-		"""Write multiple AppState keys (patch-per-key to avoid full-state replacement)."""
+		"""Write multiple AppState keys (one bridge message, still patch-per-key on the UI side)."""
+		patch: dict[str, Any] = {}
 		for k, v in values.items():
-			self.set_state(str(k), v)
+			key = str(k or "").strip()
+			if key:
+				patch[key] = v
+		if not patch:
+			return
+		for k, v in patch.items():
+			try:
+				self._ctx._update_app_state(k, v)
+			except Exception:
+				pass
+		bridge = self._ctx.bridge
+		try:
+			emit_many = getattr(bridge, "emit_patch_many", None)
+			if callable(emit_many):
+				emit_many(patch)
+			else:
+				for k, v in patch.items():
+					bridge.emit_patch(k, v)
+		except Exception:
+			pass
 
 	def _resolve_button_state_key(self, button_key: str, *, view_id: str | None = None) -> str:
 		raw = str(button_key or "").strip()
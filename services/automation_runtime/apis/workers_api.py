@@ -19,6 +19,8 @@ from services.automation_runtime.apis.api_utils import to_int
 ITAC_NO_USER_LOGGED_RV = -104
 ITAC_USER_ALREADY_LOGGED_RV = -106
 
+_WAIT_ERROR_CODES = frozenset({"worker_error", "timeout"})
+
 class WorkersApi:
 	"""
 	Simple worker I/O helpers for non-programmer Automation Runtime scripts.
@@ -32,6 +34,12 @@ class WorkersApi:
 
 	def __init__(self, ctx: Any) -> None:
 		self._ctx = ctx
+		# Probe once whether ctx accepts the slow-tick suppression flag.
+		try:
+			ctx._suppress_slow_tick_warning_once = False
+			self._can_suppress = True
+		except Exception:
+			self._can_suppress = False
 
 	def _itac_connection_error_result(
 		self,
@@ -101,10 +109,8 @@ class WorkersApi:
 		if timeout_s <= 0:
 			timeout_s = 0.01
 		# Blocking waits are intentional in scripts; suppress one slow-tick warning.
-		try:
+		if self._can_suppress:
 			self._ctx._suppress_slow_tick_warning_once = True
-		except Exception:
-			pass
 
 		bus = getattr(self._ctx, "worker_bus", None)
 		if bus is None or not hasattr(bus, "subscribe_many"):
@@ -223,7 +229,7 @@ class WorkersApi:
 			timeout_s=float(timeout_s),
 		)
 
-		if msg_payload.get("error") in ("worker_error", "timeout"):
+		if msg_payload.get("error") in _WAIT_ERROR_CODES:
 			return default
 
 		value = msg_payload.get("value", default)
@@ -275,7 +281,7 @@ class WorkersApi:
 			timeout_s=float(timeout_s),
 		)
 
-		if msg_payload.get("error") in ("worker_error", "timeout"):
+		if msg_payload.get("error") in _WAIT_ERROR_CODES:
 			return default
 
 		return msg_payload.get("value", default)
@@ -302,7 +308,7 @@ class WorkersApi:
 			timeout_s=float(timeout_s),
 		)
 
-		if msg_payload.get("error") in ("worker_error", "timeout"):
+		if msg_payload.get("error") in _WAIT_ERROR_CODES:
 			return default
 
 		return msg_payload.get("value", default)
@@ -1125,7 +1131,7 @@ class WorkersApi:
 			timeout_s=float(timeout_s),
 		)
 
-		if msg.get("error") in ("worker_error", "timeout"):
+		if msg.get("error") in _WAIT_ERROR_CODES:
 			return default
 
 		return msg.get("value", default)
@@ -25,6 +25,39 @@ class AutomationContext:
     - Scripts should receive `public`, which exposes a stable, limited API.
     """
 
+    # Fixed attribute set: the runtime reads these directly on every tick.
+    __slots__ = (
+        "chain_id",
+        "worker_bus",
+        "bridge",
+        "state",
+        "send_cmd",
+        "data",
+        "bus_last",
+        "bus_events",
+        "step",
+        "next_step",
+        "step_time",
+        "step_elapsed_s",
+        "cycle_time",
+        "cycle_count",
+        "paused",
+        "_step_started_ts",
+        "error_flag",
+        "error_message",
+        "step_desc",
+        "_suppress_slow_tick_warning_once",
+        "_publish_changes",
+        "_vars",
+        "_ui_state",
+        "_app_state",
+        "_last_seen_by_source",
+        "_public",
+        "_modal_pending",
+        "_modal_result_by_key",
+        "_modal_key_by_request_id",
+    )
+
     def __init__(
         self,
         chain_id: str,
@@ -40,6 +73,9 @@ class AutomationContext:
         self.send_cmd = send_cmd
 
         self.data: Dict[str, Dict[str, Any]] = {}
+        # Latest bus message per source_id, and latest payload per (source_id, topic).
+        self.bus_last: Dict[str, Dict[str, Any]] = {}
+        self.bus_events: Dict[str, Dict[str, Any]] = {}
 
         self.step = 0
         self.next_step = 0
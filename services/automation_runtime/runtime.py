@@ -1,24 +1,51 @@
 from __future__ import annotations
 
+import itertools
+import math
 import queue
+import sys
 import threading
 import time
 import traceback
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
 from loguru import logger
 
 from services.ui_bridge import UiBridge
-from services.worker_bus import BusMessage, WorkerBus
+from services.worker_bus import BusMessage, WorkerBus, drain_queue
 from services.worker_commands import ScriptWorkerCommands as Commands
 from services.worker_topics import WorkerTopics as Topics
 from services.automation_runtime.context import AutomationContext
 from services.automation_runtime.loader import AutomationScriptLoader
 
 
-@dataclass
+# Plain-str topic values compared on every bus message.
+_T_VALUE_CHANGED = Topics.VALUE_CHANGED.value
+_T_MODAL_RESPONSE = Topics.TOPIC_MODAL_RESPONSE.value
+
+# Source id the runtime is currently publishing as. Module-level, as the
+# contextvars docs require; as_source() scopes it per thread with set/reset.
+_current_source_id: ContextVar[str] = ContextVar("automation_runtime_source_id", default="")
+
+_inbox_seq = itertools.count()
+
+
+def _inbox_key(msg: BusMessage) -> Any:
+    """Keyed VALUE_CHANGED messages collapse to the latest per (source, source_id, key);
+    _update_bus_value keeps only that one anyway. Everything else gets a unique key."""
+    if msg.topic == _T_VALUE_CHANGED:
+        payload = msg.payload
+        if isinstance(payload, dict) and "value" in payload:
+            key = payload.get("key")
+            if key:
+                return (msg.source, msg.source_id, str(key))
+    return next(_inbox_seq)
+
+
+@dataclass(slots=True)
 class ChainInstance:
     script_name: str
     instance_id: str
@@ -28,7 +55,13 @@ class ChainInstance:
     paused: bool = False
     next_tick_ts: float = 0.0
     stop_event: threading.Event = field(default_factory=threading.Event)
+    # Set by pause/resume/retry/stop so the runner re-checks state immediately.
+    wakeup: threading.Event = field(default_factory=threading.Event)
     lock: threading.Lock = field(default_factory=threading.Lock)
+    # Bus messages fanned out by the runtime thread, applied by the chain thread.
+    # Insertion-ordered; see _inbox_key for which messages replace each other.
+    inbox: dict[Any, BusMessage] = field(default_factory=dict)
+    inbox_lock: threading.Lock = field(default_factory=threading.Lock)
     thread: Optional[threading.Thread] = None
 
 
@@ -59,13 +92,19 @@ class AutomationRuntime:
         self.reload_check_interval = float(reload_check_interval or 1.0)
         self.hot_reload_enabled = False
         self.last_reload_check = 0.0
+        self._next_reload_ts = math.inf  # monotonic deadline; inf while hot reload is off
 
         self.chains: dict[str, ChainInstance] = {}
-        self._last_script_sig = ""
-        self._last_chain_sig = ""
+        # Immutable copy of chains.items(), rebuilt on every add/remove. Loops
+        # iterate this so a chain thread never walks the dict mid-mutation.
+        self._chains_snapshot: tuple[tuple[str, ChainInstance], ...] = ()
+        self._last_script_sig: Optional[tuple] = None
+        self._last_chain_sig: Optional[tuple] = None
+        # Set whenever a field in the chain list may have changed; lets the
+        # run loop skip rebuilding the list payload while nothing moves.
+        self._chains_dirty = True
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._current_source_id: str = ""
 
         self.bus_sub = self.worker_bus.subscribe_many([
             Topics.VALUE_CHANGED,
@@ -116,18 +155,18 @@ class AutomationRuntime:
 
     @contextmanager
     def as_source(self, source_id: str):
-        prev = self._current_source_id
-        self._current_source_id = str(source_id or "")
+        token = _current_source_id.set(str(source_id or ""))
         try:
             yield
         finally:
-            self._current_source_id = prev
+            _current_source_id.reset(token)
 
     def _pub(self, topic: Topics, **payload: Any) -> None:
-        if not self._current_source_id:
+        source_id = _current_source_id.get()
+        if not source_id:
             self.log.error(f"[publish] - missing_source_id - topic={topic} payload_keys={list(payload.keys())}")
             return
-        self.worker_bus.publish(topic=topic, source=self.name, source_id=self._current_source_id, **payload)
+        self.worker_bus.publish(topic=topic, source=self.name, source_id=source_id, **payload)
 
     def publish_value_as(self, source_id: str, key: str, value: Any) -> None:
         with self.as_source(source_id):
@@ -139,7 +178,7 @@ class AutomationRuntime:
 
     def _build_chain_list_payload(self) -> list[dict[str, Any]]:
         items: list[dict[str, Any]] = []
-        for chain_key, inst in self.chains.items():
+        for chain_key, inst in self._chains_snapshot:
             if not inst.lock.acquire(timeout=0.01):
                 continue
             try:
@@ -150,11 +189,11 @@ class AutomationRuntime:
                     "instance": inst.instance_id,
                     "active": bool(inst.active),
                     "paused": bool(inst.paused),
-                    "error_flag": bool(getattr(ctx, "error_flag", False)),
-                    "error_message": str(getattr(ctx, "error_message", "") or ""),
-                    "step": getattr(ctx, "step", 0),
-                    "cycle_count": getattr(ctx, "cycle_count", 0),
-                    "step_time": getattr(ctx, "step_time", 0.0),
+                    "error_flag": bool(ctx.error_flag),
+                    "error_message": str(ctx.error_message or ""),
+                    "step": ctx.step,
+                    "cycle_count": ctx.cycle_count,
+                    "step_time": ctx.step_time,
                 })
             finally:
                 inst.lock.release()
@@ -162,45 +201,37 @@ class AutomationRuntime:
 
     def _publish_scripts_if_changed(self, force: bool = False) -> None:
         scripts = self.loader.list_available_scripts()
-        sig = "|".join([str(x) for x in (scripts or [])])
+        sig = tuple(scripts or ())
         if force or sig != self._last_script_sig:
             self._last_script_sig = sig
             self.publish_value_as(self.name, Commands.LIST_SCRIPTS, scripts)
             self.log.debug(f"[scripts] - list_updated - count={len(scripts or [])}")
 
     def _publish_chains_if_changed(self, force: bool = False) -> None:
+        if not force and not self._chains_dirty:
+            return
+        self._chains_dirty = False
         payload = self._build_chain_list_payload()
-        sig = "|".join([
-            "%s:%s:%s:%s:%s:%s"
-            % (
-                str(x.get("key", "")),
-                str(x.get("active", False)),
-                str(x.get("paused", False)),
-                str(x.get("error_flag", False)),
-                str(x.get("error_message", "")),
-                str(x.get("step", 0)),
-            )
+        if len(payload) < len(self._chains_snapshot):
+            # A busy chain was skipped; look again on the next loop.
+            self._chains_dirty = True
+        sig = tuple(
+            (x["key"], x["active"], x["paused"], x["error_flag"], x["error_message"], x["step"])
             for x in payload
-        ])
+        )
         if force or sig != self._last_chain_sig:
             self._last_chain_sig = sig
             self.publish_value_as(self.name, Commands.LIST_CHAINS, payload)
 
-    def _publish_chain_state(self, chain_key: str, ctx: AutomationContext) -> None:
+    def _publish_chain_state(self, chain_key: str, inst: ChainInstance) -> None:
         try:
-            raw_state = ctx.get_state()
-            safe_state = dict(raw_state) if isinstance(raw_state, dict) else {"state": raw_state}
-            safe_state.setdefault("chain_key", chain_key)
-            if ":" in chain_key:
-                script_name, instance_id = chain_key.split(":", 1)
-                safe_state.setdefault("script_name", script_name)
-                safe_state.setdefault("instance_id", instance_id)
-            inst = self.chains.get(chain_key)
-            if inst is not None:
-                safe_state["active"] = bool(inst.active)
-                safe_state["paused"] = bool(inst.paused)
-            safe_state.setdefault("error_flag", bool(getattr(ctx, "error_flag", False)))
-            safe_state.setdefault("error_message", str(getattr(ctx, "error_message", "") or ""))
+            # get_state() builds a fresh dict on every call, so it is safe to extend in place.
+            safe_state = inst.context.get_state()
+            safe_state["chain_key"] = chain_key
+            safe_state["script_name"] = inst.script_name
+            safe_state["instance_id"] = inst.instance_id
+            safe_state["active"] = bool(inst.active)
+            safe_state["paused"] = bool(inst.paused)
             self.publish_value_as(chain_key, Commands.UPDATE_CHAIN_STATE, safe_state)
         except Exception:
             self.publish_error_as(chain_key, key=chain_key, action="publish_chain_state", error=self._format_exc())
@@ -209,8 +240,8 @@ class AutomationRuntime:
         payload = {"chain_key": chain_key, "step": 0, "step_desc": "", "level": str(level), "message": str(message)}
         inst = self.chains.get(chain_key)
         if inst is not None:
-            payload["step"] = int(getattr(inst.context, "step", 0))
-            payload["step_desc"] = str(getattr(inst.context, "step_desc", "") or "")
+            payload["step"] = int(inst.context.step)
+            payload["step_desc"] = str(inst.context.step_desc or "")
         self.publish_value_as(chain_key, Commands.UPDATE_LOG, payload)
 
     def _apply_bus_msg_to_ctx(self, ctx: AutomationContext, msg: BusMessage) -> None:
@@ -218,55 +249,63 @@ class AutomationRuntime:
         source = getattr(msg, "source", "") or "unknown"
         source_id = getattr(msg, "source_id", "") or ""
         payload = getattr(msg, "payload", None) or {}
-        ctx.data.setdefault("bus_last", {})[source_id] = {"topic": topic, "payload": payload, "ts": time.time()}
+        if topic == _T_MODAL_RESPONSE:
+            request_id = payload.get("request_id")
+            if request_id is not None:
+                ctx._modal_set_result_for_request(str(request_id), payload.get("result"))
+            return
+        ctx.bus_last[source_id] = {"topic": topic, "payload": payload, "ts": time.monotonic()}
 
-        if topic == str(Topics.VALUE_CHANGED.value):
+        if topic == _T_VALUE_CHANGED:
             ctx._update_bus_value(source=source, source_id=source_id, payload=payload)
         else:
-            ctx.data.setdefault("bus_events", {}).setdefault(source_id, {})[topic] = payload
+            events = ctx.bus_events.get(source_id)
+            if events is None:
+                ctx.bus_events[source_id] = {topic: payload}
+            else:
+                events[topic] = payload
 
     def _drain_bus_updates(self, max_items: int) -> None:
+        broadcast: list[tuple[Any, BusMessage]] = []
+
         def _drain_queue(q: "queue.Queue[BusMessage]", handle_modal: bool) -> int:
             processed = 0
-            for _ in range(max_items):
-                try:
-                    msg = q.get_nowait()
-                except queue.Empty:
-                    break
-                if handle_modal and str(getattr(msg, "topic", "") or "") == Topics.TOPIC_MODAL_RESPONSE:
+            for msg in drain_queue(q, max_items):
+                if handle_modal and str(getattr(msg, "topic", "") or "") == _T_MODAL_RESPONSE:
+                    # Only the requesting chain sees the response; it applies it from its inbox.
                     payload = getattr(msg, "payload", None) or {}
                     inst = self.chains.get(str(payload.get("chain_id") or ""))
-                    request_id = payload.get("request_id")
-                    if inst and request_id is not None:
-                        with inst.lock:
-                            inst.context._modal_set_result_for_request(str(request_id), payload.get("result"))
+                    if inst and payload.get("request_id") is not None:
+                        with inst.inbox_lock:
+                            inst.inbox[next(_inbox_seq)] = msg
                     continue
 
-                for inst in self.chains.values():
-                    if not inst.lock.acquire(blocking=False):
-                        continue
-                    try:
-                        if inst.active:
-                            self._apply_bus_msg_to_ctx(inst.context, msg)
-                    finally:
-                        inst.lock.release()
+                broadcast.append((_inbox_key(msg), msg))
                 processed += 1
             return processed
 
         processed = _drain_queue(self.bus_sub.queue, handle_modal=True)
         if processed < max_items:
             _drain_queue(self.bus_sub_view_cmd.queue, handle_modal=False)
+        if not broadcast:
+            return
+
+        for _, inst in self._chains_snapshot:
+            if not inst.active:
+                continue
+            with inst.inbox_lock:
+                inbox = inst.inbox
+                for key, msg in broadcast:
+                    # Re-insert so a replaced message moves to the end, keeping apply order.
+                    inbox.pop(key, None)
+                    inbox[key] = msg
 
     def _drain_ui_state_updates(self, max_items: int) -> None:
-        for _ in range(max_items):
-            try:
-                msg = self.ui_state_sub.queue.get_nowait()
-            except queue.Empty:
-                break
+        for msg in drain_queue(self.ui_state_sub.queue, max_items):
             topic = str(getattr(msg, "topic", "") or "")
             payload = getattr(msg, "payload", None)
             data = payload if isinstance(payload, dict) else {}
-            for inst in self.chains.values():
+            for _, inst in self._chains_snapshot:
                 if not inst.lock.acquire(blocking=False):
                     continue
                 try:
@@ -283,12 +322,13 @@ class AutomationRuntime:
 
     def _get_cycle_time_s(self, ctx: AutomationContext) -> float:
         try:
-            return max(0.1, float(getattr(ctx, "cycle_time", 0.1) or 0.1))
+            return max(0.1, float(ctx.cycle_time or 0.1))
         except Exception:
             return 0.1
 
     def _chain_runner(self, chain_key: str, inst: ChainInstance) -> None:
         self.log.info(f"[chain] - started - chain_key={chain_key}")
+        now = time.monotonic
         while not self.stop_event.is_set() and not self.bridge.stopped() and not inst.stop_event.is_set():
             should_sleep = 0.02
             need_tick = False
@@ -296,42 +336,56 @@ class AutomationRuntime:
             with inst.lock:
                 if not inst.active:
                     break
+                with inst.inbox_lock:
+                    pending, inst.inbox = inst.inbox, {}
+                for msg in pending.values():
+                    self._apply_bus_msg_to_ctx(inst.context, msg)
                 if inst.paused:
-                    now_ts = time.time()
+                    should_sleep = 0.05
+                    now_ts = now()
                     if inst.context._step_started_ts <= 0:
                         inst.context._step_started_ts = now_ts
                     inst.context.step_elapsed_s = max(0.0, now_ts - inst.context._step_started_ts)
                 else:
-                    now = time.time()
-                    if not inst.next_tick_ts or now >= inst.next_tick_ts:
-                        inst.context.cycle_count = inst.context.cycle_count + 1
+                    now_ts = now()
+                    if not inst.next_tick_ts or now_ts >= inst.next_tick_ts:
+                        ctx = inst.context
+                        ctx.cycle_count = ctx.cycle_count + 1
+                        cycle = int(ctx.cycle_count)
                         need_tick = True
                         fn = inst.fn
+                        list_fields = (ctx.step, ctx.error_flag, ctx.error_message)
                     else:
-                        should_sleep = max(0.0, min(0.05, inst.next_tick_ts - now))
+                        should_sleep = max(0.0, inst.next_tick_ts - now_ts)
 
             if need_tick and fn:
-                cycle = int(getattr(inst.context, "cycle_count", 0))
                 try:
-                    start = time.time()
-                    fn(inst.context.public)
-                    elapsed_ms = (time.time() - start) * 1000.0
+                    start = now()
+                    fn(ctx.public)
+                    end = now()
+                    elapsed_ms = (end - start) * 1000.0
+                    # Everything below is written only by this thread (runner or script),
+                    # so it is read and prepared unlocked; the lock covers the commit.
+                    step_time = round(elapsed_ms, 2)
+                    next_step = int(ctx.next_step)
+                    step_changed = next_step != int(ctx.step)
+                    next_tick_ts = end + self._get_cycle_time_s(ctx)
+                    suppress_slow_warn = bool(ctx._suppress_slow_tick_warning_once)
+                    publish_changes = bool(ctx._publish_changes)
                     with inst.lock:
-                        inst.context.step_time = round(elapsed_ms, 2)
-                        prev_step = int(getattr(inst.context, "step", 0))
-                        next_step = int(getattr(inst.context, "next_step", prev_step))
-                        if next_step != prev_step:
-                            inst.context._step_started_ts = time.time()
-                            inst.context.step_elapsed_s = 0.0
-                        inst.context.step = next_step
-                        inst.next_tick_ts = time.time() + self._get_cycle_time_s(inst.context)
-                        suppress_slow_warn = bool(getattr(inst.context, "_suppress_slow_tick_warning_once", False))
-                        inst.context._suppress_slow_tick_warning_once = False
-                        publish_changes = bool(getattr(inst.context, "_publish_changes", True))
+                        ctx.step_time = step_time
+                        if step_changed:
+                            ctx._step_started_ts = end
+                            ctx.step_elapsed_s = 0.0
+                        ctx.step = next_step
+                        inst.next_tick_ts = next_tick_ts
+                        ctx._suppress_slow_tick_warning_once = False
+                    if (next_step, ctx.error_flag, ctx.error_message) != list_fields:
+                        self._chains_dirty = True
                     if elapsed_ms > 200 and not suppress_slow_warn:
                         self.log.warning(f"[chain] - slow_tick - chain_key={chain_key} duration_ms={elapsed_ms:.2f} cycle={cycle}")
                     if publish_changes:
-                        self._publish_chain_state(chain_key, inst.context)
+                        self._publish_chain_state(chain_key, inst)
                     should_sleep = 0.001
                 except Exception:
                     err = self._format_exc()
@@ -342,15 +396,17 @@ class AutomationRuntime:
                         inst.context.paused = True
                         inst.context.error_flag = True
                         inst.context.error_message = "Automation runtime crashed. Please review and press Retry."
+                    self._chains_dirty = True
                     self._publish_chain_log(chain_key, "chain crashed - paused; operator can retry", level="error")
-                    self._publish_chain_state(chain_key, inst.context)
+                    self._publish_chain_state(chain_key, inst)
                     self._publish_chains_if_changed(True)
                     try:
                         self.bridge.emit_notify(f"⚠️ Script '{chain_key}' crashed. Open Scripts Lab and press Retry.", "warning")
                     except Exception:
                         pass
                     should_sleep = 0.05
-            time.sleep(should_sleep)
+            inst.wakeup.wait(should_sleep)
+            inst.wakeup.clear()
         self.log.info(f"[chain] - stopped - chain_key={chain_key}")
 
     def _run_loop(self) -> None:
@@ -375,9 +431,10 @@ class AutomationRuntime:
 
         try:
             while not self.stop_event.is_set() and not self.bridge.stopped():
-                now = time.time()
-                if self.hot_reload_enabled and self.reload_check_interval > 0 and (now - self.last_reload_check) >= self.reload_check_interval:
+                now = time.monotonic()
+                if now >= self._next_reload_ts:
                     self.last_reload_check = now
+                    self._next_reload_ts = now + self.reload_check_interval
                     try:
                         reloaded = self.loader.check_for_updates()
                         names = [str(x) for x in reloaded] if isinstance(reloaded, (list, tuple, set)) else []
@@ -393,9 +450,14 @@ class AutomationRuntime:
                 self._drain_ui_state_updates(200)
                 self._dispatch_commands(handlers, limit=200)
                 self._publish_chains_if_changed(False)
-                time.sleep(0.05)
+                # Sleep until the next drain is due, but run a command as soon as it arrives.
+                try:
+                    cmd, payload = self.commands.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                self._handle_command(handlers, cmd, payload)
         finally:
-            for chain_key in list(self.chains.keys()):
+            for chain_key, _ in self._chains_snapshot:
                 self._stop_chain(chain_key, "runtime_shutdown")
             self.bus_sub.close()
             self.bus_sub_view_cmd.close()
@@ -404,31 +466,36 @@ class AutomationRuntime:
             self.log.info("[loop] - stopped")
 
     def _dispatch_commands(self, handlers: dict[str, Callable[[dict[str, Any]], None]], limit: int = 50) -> None:
-        for _ in range(limit):
-            try:
-                cmd, payload = self.commands.get_nowait()
-            except queue.Empty:
+        # The runtime thread is the only consumer, so qsize() items are guaranteed to be there.
+        for _ in range(min(limit, self.commands.qsize())):
+            cmd, payload = self.commands.get_nowait()
+            if not self._handle_command(handlers, cmd, payload):
                 return
-            if str(cmd) == "__stop__":
-                return
-            handler = handlers.get(str(cmd))
-            if not handler:
-                self.log.debug(f"[command] - ignored_unknown - cmd={cmd}")
-                continue
-            try:
-                handler(payload or {})
-            except Exception:
-                self.publish_error_as(self.name, key=self.name, action=f"cmd:{cmd}", error=self._format_exc())
+
+    def _handle_command(self, handlers: dict[str, Callable[[dict[str, Any]], None]], cmd: str, payload: dict[str, Any]) -> bool:
+        """Run one queued command; returns False for the internal stop marker."""
+        if str(cmd) == "__stop__":
+            return False
+        handler = handlers.get(str(cmd))
+        if not handler:
+            self.log.debug(f"[command] - ignored_unknown - cmd={cmd}")
+            return True
+        try:
+            handler(payload or {})
+        except Exception:
+            self.publish_error_as(self.name, key=self.name, action=f"cmd:{cmd}", error=self._format_exc())
+        return True
 
     def _resolve_chain_key(self, payload: dict[str, Any]) -> str:
+        # Interned so the chains lookup that follows compares by identity.
         ck = payload.get("chain_key") or payload.get("key")
         if ck:
-            return str(ck)
+            return sys.intern(ck if type(ck) is str else str(ck))
         script_name = payload.get("script") or payload.get("script_name")
         instance_id = payload.get("instance_id") or payload.get("id") or "default"
         if not script_name:
             return ""
-        return f"{script_name}:{instance_id}"
+        return sys.intern(f"{script_name}:{instance_id}")
 
     def _cmd_set_hot_reload(self, payload: dict[str, Any]) -> None:
         self.hot_reload_enabled = bool(payload.get("enabled", False))
@@ -439,6 +506,10 @@ class AutomationRuntime:
                     self.reload_check_interval = interval
             except Exception:
                 pass
+        if self.hot_reload_enabled:
+            self._next_reload_ts = self.last_reload_check + self.reload_check_interval
+        else:
+            self._next_reload_ts = math.inf
         self.log.info(f"[hot_reload] - updated enabled={self.hot_reload_enabled} interval_s={self.reload_check_interval}")
 
     def _cmd_list_scripts(self, payload: dict[str, Any]) -> None:
@@ -453,7 +524,7 @@ class AutomationRuntime:
         if not script_name:
             self.publish_error_as(self.name, key=self.name, action="start_chain", error="missing payload.script/script_name")
             return
-        chain_key = f"{script_name}:{instance_id}"
+        chain_key = sys.intern(f"{script_name}:{instance_id}")
         if chain_key in self.chains:
             self._stop_chain(chain_key, "restart")
 
@@ -464,12 +535,13 @@ class AutomationRuntime:
         ctx = AutomationContext(chain_id=chain_key, worker_bus=self.worker_bus, bridge=self.bridge, state=self.bridge, send_cmd=self.send_cmd)
         inst = ChainInstance(script_name=str(script_name), instance_id=str(instance_id), context=ctx, fn=fn)
         self.chains[chain_key] = inst
+        self._chains_snapshot = tuple(self.chains.items())
         inst.thread = threading.Thread(target=self._chain_runner, args=(chain_key, inst), daemon=True, name=f"chain:{chain_key}")
         inst.thread.start()
         self.log.info(f"[chain] - created - chain_key={chain_key}")
         self._publish_chain_log(chain_key, "chain started", level="info")
         self._publish_chains_if_changed(True)
-        self._publish_chain_state(chain_key, ctx)
+        self._publish_chain_state(chain_key, inst)
 
     def _cmd_stop_chain(self, payload: dict[str, Any]) -> None:
         chain_key = self._resolve_chain_key(payload)
@@ -487,9 +559,10 @@ class AutomationRuntime:
         with inst.lock:
             inst.paused = True
             inst.context.paused = True
+        inst.wakeup.set()
         self._publish_chain_log(chain_key, "chain paused", level="info")
         self._publish_chains_if_changed(True)
-        self._publish_chain_state(chain_key, inst.context)
+        self._publish_chain_state(chain_key, inst)
 
     def _cmd_resume_chain(self, payload: dict[str, Any]) -> None:
         chain_key = self._resolve_chain_key(payload)
@@ -501,9 +574,10 @@ class AutomationRuntime:
             inst.paused = False
             inst.context.paused = False
             inst.next_tick_ts = 0.0
+        inst.wakeup.set()
         self._publish_chain_log(chain_key, "chain resumed", level="info")
         self._publish_chains_if_changed(True)
-        self._publish_chain_state(chain_key, inst.context)
+        self._publish_chain_state(chain_key, inst)
 
     def _cmd_retry_chain(self, payload: dict[str, Any]) -> None:
         chain_key = self._resolve_chain_key(payload)
@@ -517,12 +591,13 @@ class AutomationRuntime:
             inst.paused = False
             inst.context.paused = False
             inst.next_tick_ts = 0.0
+        inst.wakeup.set()
         self._publish_chain_log(chain_key, "retry requested by operator", level="info")
         self._publish_chains_if_changed(True)
-        self._publish_chain_state(chain_key, inst.context)
+        self._publish_chain_state(chain_key, inst)
 
     def _apply_reloaded_scripts(self, script_names: list[str]) -> None:
-        for chain_key, inst in self.chains.items():
+        for chain_key, inst in self._chains_snapshot:
             if inst.active and inst.script_name in script_names:
                 fn = self.loader.load_script(inst.script_name, force=True)
                 if fn:
@@ -559,9 +634,11 @@ class AutomationRuntime:
         with inst.lock:
             inst.active = False
             inst.stop_event.set()
+        inst.wakeup.set()
         if inst.thread and inst.thread.is_alive():
             inst.thread.join(timeout=1.0)
         self.chains.pop(chain_key, None)
+        self._chains_snapshot = tuple(self.chains.items())
         self.log.info(f"[chain] - removed - chain_key={chain_key} reason={reason}")
         self._publish_chain_log(chain_key, f"chain stopped: {reason}", level="info")
         self._publish_chains_if_changed(True)
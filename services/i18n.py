@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import atexit
+import contextvars
 import inspect
 import json
 import os
 import threading
+from contextlib import contextmanager
 from copy import deepcopy
 from typing import Any
 
 from loguru import logger
 from nicegui import app
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 I18N_PATH = "config/i18n/translations.json"
 DEFAULT_LANGUAGE = "en"
 SUPPORTED_LANGUAGES: list[dict[str, str]] = [
@@ -22,6 +30,7 @@ SUPPORTED_LANGUAGES: list[dict[str, str]] = [
     {"code": "cs", "label": "Čeština"},
 ]
 SUPPORTED_LANGUAGE_CODES = [entry["code"] for entry in SUPPORTED_LANGUAGES]
+_SUPPORTED_LANGUAGE_SET = frozenset(SUPPORTED_LANGUAGE_CODES)
 
 _DEFAULT_TRANSLATIONS: dict[str, dict[str, str]] = {
     "app.title": {
@@ -71,28 +80,82 @@ _DEFAULT_TRANSLATIONS: dict[str, dict[str, str]] = {
     },
 }
 
-_i18n_lock = threading.RLock()
+# (lang, key) -> text for the built-in defaults, merged into every reload.
+_DEFAULT_FLAT: dict[tuple[str, str], str] = {
+    (lang, key): text
+    for key, values in _DEFAULT_TRANSLATIONS.items()
+    for lang, text in values.items()
+}
+
+# Serializes writers only; readers use the current snapshot without locking.
+_i18n_lock = threading.Lock()
+
+# (file stat key, parsed translations, flat (lang, key) -> (text, needs_format)).
+# Rebuilt off to the side and rebound as a whole, so readers always see a
+# consistent triple. The stat key is (mtime_ns, size) of I18N_PATH. The flat
+# table only holds non-empty texts; needs_format is False for texts without
+# braces so t() can skip str.format().
+_FlatTranslations = dict[tuple[str, str], tuple[str, bool]]
+_TranslationsSnapshot = tuple[tuple[int, int], dict[str, dict[str, str]], _FlatTranslations]
+_snapshot: _TranslationsSnapshot | None = None
+
+# Language pinned for the current render pass as (language, generation).
+# set_language() bumps the generation, which invalidates every pin.
+_render_language: contextvars.ContextVar[tuple[str, int] | None] = contextvars.ContextVar(
+    "i18n_render_language", default=None
+)
+_language_generation = 0
+
+# Missing keys waiting to be written: key -> (fallback text, callsite).
+_MISSING_FLUSH_DELAY_S = 1.0
+_missing_entries: dict[str, tuple[str, str]] = {}
+_missing_flush_timer: threading.Timer | None = None
 
 
 def _ensure_i18n_file() -> None:
+    """Create the translations file with defaults. Caller holds _i18n_lock."""
     os.makedirs(os.path.dirname(I18N_PATH), exist_ok=True)
     if os.path.exists(I18N_PATH):
         return
-    save_translations(_DEFAULT_TRANSLATIONS)
+    _save_translations_locked(_DEFAULT_TRANSLATIONS)
 
 
 def _capture_missing_key(key: str, default_text: str, *, location: str) -> None:
+    """Queue a missing key; writes are coalesced by a short debounce timer."""
+    global _missing_flush_timer
+    with _i18n_lock:
+        if key in _missing_entries or key in _load_snapshot_locked()[1]:
+            return
+        _missing_entries[key] = (str(default_text or key), location)
+        if _missing_flush_timer is None:
+            _missing_flush_timer = threading.Timer(_MISSING_FLUSH_DELAY_S, _flush_missing_keys)
+            _missing_flush_timer.daemon = True
+            _missing_flush_timer.start()
+
+
+def _flush_missing_keys() -> None:
+    global _missing_entries, _missing_flush_timer
     with _i18n_lock:
-        data = load_translations()
-        if key in data:
+        pending, _missing_entries = _missing_entries, {}
+        _missing_flush_timer = None
+        if not pending:
+            return
+        # The loaded dict is shared with readers; copy before mutating.
+        data = dict(_load_snapshot_locked()[1])
+        added = {key: entry for key, entry in pending.items() if key not in data}
+        if not added:
             return
-        fallback = str(default_text or key)
-        data[key] = {lang: fallback for lang in SUPPORTED_LANGUAGE_CODES}
+        for key, (fallback, _location) in added.items():
+            data[key] = {lang: fallback for lang in SUPPORTED_LANGUAGE_CODES}
         try:
-            save_translations(data)
-            logger.info(f"[_capture_missing_key] - added_missing_key_to_translations - key={key} location={location}")
+            _save_translations_locked(data)
+            for key, (_fallback, location) in added.items():
+                logger.info(f"[_flush_missing_keys] - added_missing_key_to_translations - key={key} location={location}")
         except Exception:
-            logger.exception(f"[_capture_missing_key] - failed_write_translations - key={key} location={location}")
+            logger.exception(f"[_flush_missing_keys] - failed_write_translations - keys={len(added)}")
+
+
+atexit.register(_flush_missing_keys)
 
 
 def _get_callsite() -> str:
@@ -107,26 +170,97 @@ def _get_callsite() -> str:
     return f"{module}.{fn_name}"
 
 
-def load_translations() -> dict[str, dict[str, str]]:
-    with _i18n_lock:
+def _stat_key() -> tuple[int, int] | None:
+    try:
+        st = os.stat(I18N_PATH)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_snapshot_locked() -> _TranslationsSnapshot:
+    """Return a snapshot matching the file on disk. Caller holds _i18n_lock."""
+    global _snapshot
+    stat_key = _stat_key()
+    if stat_key is None:
         _ensure_i18n_file()
+        stat_key = _stat_key()
+    snap = _snapshot
+    if snap is not None and snap[0] == stat_key:
+        return snap
+
+    if orjson is not None:
+        with open(I18N_PATH, "rb") as f:
+            raw = orjson.loads(f.read())
+    else:
         with open(I18N_PATH, "r", encoding="utf-8") as f:
             raw = json.load(f)
     parsed: dict[str, dict[str, str]] = {}
     for key, values in raw.items():
         if not isinstance(values, dict):
             continue
-        parsed[key] = {str(lang): str(text) for lang, text in values.items()}
-    for key, values in _DEFAULT_TRANSLATIONS.items():
-        parsed.setdefault(key, {}).update({k: v for k, v in values.items() if not parsed[key].get(k)})
-    return parsed
+        # JSON object keys are always str; only coerce non-string values.
+        parsed[key] = {lang: text if type(text) is str else str(text) for lang, text in values.items()}
+    for (lang, key), text in _DEFAULT_FLAT.items():
+        values = parsed.setdefault(key, {})
+        if not values.get(lang):
+            values[lang] = text
+    flat: _FlatTranslations = {
+        (lang, key): (text, "{" in text or "}" in text)
+        for key, values in parsed.items()
+        for lang, text in values.items()
+        if text
+    }
+
+    snap = (stat_key, parsed, flat)
+    _snapshot = snap
+    return snap
+
+
+def _current_snapshot() -> _TranslationsSnapshot:
+    snap = _snapshot
+    if snap is not None and snap[0] == _stat_key():
+        return snap
+    with _i18n_lock:
+        return _load_snapshot_locked()
 
 
-def save_translations(translations: dict[str, dict[str, str]]) -> None:
-    with _i18n_lock:
-        os.makedirs(os.path.dirname(I18N_PATH), exist_ok=True)
-        with open(I18N_PATH, "w", encoding="utf-8") as f:
+def load_translations() -> dict[str, dict[str, str]]:
+    """
+    Return the parsed translations table.
+
+    The result is cached and only re-read when the file's mtime or size
+    changes. It is shared between callers: treat it as read-only and copy
+    before mutating.
+    """
+    return _current_snapshot()[1]
+
+
+def _save_translations_locked(translations: dict[str, dict[str, str]], *, fsync: bool = False) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    global _snapshot
+    os.makedirs(os.path.dirname(I18N_PATH), exist_ok=True)
+    tmp_path = I18N_PATH + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(translations, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(translations, f, indent=2, ensure_ascii=False, sort_keys=True)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    os.replace(tmp_path, I18N_PATH)
+    # Invalidate; readers rebuild from disk on their next lookup.
+    _snapshot = None
+
+
+def save_translations(translations: dict[str, dict[str, str]], *, fsync: bool = False) -> None:
+    with _i18n_lock:
+        _save_translations_locked(translations, fsync=fsync)
 
 
 def get_language() -> str:
@@ -135,8 +269,16 @@ def get_language() -> str:
 
     In UI context, prefer per-user language (`app.storage.user`).
     Outside UI context (e.g. script runtime threads), fall back to
-    app-wide storage and finally DEFAULT_LANGUAGE.
+    app-wide storage and finally DEFAULT_LANGUAGE. Inside language_scope()
+    the language resolved at scope entry is reused.
     """
+    pinned = _render_language.get()
+    if pinned is not None and pinned[1] == _language_generation:
+        return pinned[0]
+    return _resolve_language()
+
+
+def _resolve_language() -> str:
     lang = DEFAULT_LANGUAGE
 
     # Per-user language (only valid inside NiceGUI UI context).
@@ -147,19 +289,30 @@ def get_language() -> str:
         pass
 
     # App-wide fallback, available without user context.
-    if lang not in SUPPORTED_LANGUAGE_CODES:
+    if lang not in _SUPPORTED_LANGUAGE_SET:
         try:
             lang = app.storage.general.get("language", DEFAULT_LANGUAGE)
         except Exception:
             lang = DEFAULT_LANGUAGE
 
-    if lang not in SUPPORTED_LANGUAGE_CODES:
+    if lang not in _SUPPORTED_LANGUAGE_SET:
         return DEFAULT_LANGUAGE
     return str(lang)
 
 
+@contextmanager
+def language_scope():
+    """Resolve the active language once and reuse it for t() calls in this block."""
+    token = _render_language.set((_resolve_language(), _language_generation))
+    try:
+        yield
+    finally:
+        _render_language.reset(token)
+
+
 def set_language(language: str) -> str:
-    language = language if language in SUPPORTED_LANGUAGE_CODES else DEFAULT_LANGUAGE
+    global _language_generation
+    language = language if language in _SUPPORTED_LANGUAGE_SET else DEFAULT_LANGUAGE
     try:
         app.storage.user["language"] = language
     except Exception:
@@ -168,24 +321,27 @@ def set_language(language: str) -> str:
         app.storage.general["language"] = language
     except Exception:
         pass
+    _language_generation += 1
     logger.info(f"[set_language] - language_updated - language={language}")
     return language
 
 
 def t(key: str, default: str | None = None, *, language: str | None = None, **kwargs: Any) -> str:
-    translations = load_translations()
+    flat = _current_snapshot()[2]
     lang = str(language or get_language())
-    if lang not in SUPPORTED_LANGUAGE_CODES:
+    if lang not in _SUPPORTED_LANGUAGE_SET:
         lang = DEFAULT_LANGUAGE
-    text = translations.get(key, {}).get(lang)
-    if not text:
-        text = translations.get(key, {}).get(DEFAULT_LANGUAGE)
-    if not text:
+    entry = flat.get((lang, key)) or flat.get((DEFAULT_LANGUAGE, key))
+    if entry is None:
         fallback = default if default is not None else key
-        _capture_missing_key(key, fallback, location=_get_callsite())
-        logger.debug(f"[t] - missing_translation - key={key} lang={lang} location={_get_callsite()}")
-        text = fallback
-    if kwargs:
+        location = _get_callsite()
+        _capture_missing_key(key, fallback, location=location)
+        logger.debug(f"[t] - missing_translation - key={key} lang={lang} location={location}")
+        if kwargs:
+            return fallback.format(**kwargs)
+        return fallback
+    text, needs_format = entry
+    if kwargs and needs_format:
         return text.format(**kwargs)
     return text
 
@@ -220,12 +376,11 @@ def import_rows(rows: list[dict[str, str]]) -> dict[str, dict[str, str]]:
 
 
 def bootstrap_defaults() -> None:
-    _ensure_i18n_file()
     data = load_translations()
     merged = deepcopy(data)
     for key, values in _DEFAULT_TRANSLATIONS.items():
         merged.setdefault(key, {})
         for lang, text in values.items():
             merged[key].setdefault(lang, text)
-    save_translations(merged)
+    save_translations(merged, fsync=True)
     logger.info(f"[bootstrap_defaults] - i18n_bootstrapped - keys={len(merged)}")
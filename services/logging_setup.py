@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
 import os
 import sys
 import threading
 import time
-from collections import deque
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any
 from loguru import logger
 import traceback
@@ -20,51 +22,102 @@ LOG_FORMAT = (
 	"<level>{message}</level>"
 )
 
+# Same layout without color markup, for the non-colorized file sink.
+FILE_LOG_FORMAT = (
+	"{level.icon} {time:YYYY-MM-DD HH:mm:ss.SSS} | "
+	"{thread.name:^10}-{thread.id:^8} | "
+	"[{level:<8}] | "
+	"{name}.{function}:{line} | "
+	"{message}"
+)
+
 DEFAULT_FILE_LEVEL = "DEBUG"
 
+# Handler templates for setup_logging(); "sink" and "level" are filled per call.
+_CONSOLE_HANDLER: dict[str, Any] = {
+	"format": LOG_FORMAT,
+	"colorize": True,
+}
+_FILE_HANDLER: dict[str, Any] = {
+	"format": FILE_LOG_FORMAT,
+	"rotation": "10 MB",
+	"compression": "zip",
+	"retention": 50,      # keep 50 rotated files
+	"colorize": False,
+	"enqueue": True,      # format and write on loguru's writer thread
+}
+
+_LEVEL_COLORS = (
+	("ERROR", "<fg #ff0000>"),
+	("WARNING", "<fg #f9ff5c>"),
+	("INFO", "<cyan>"),
+	("DEBUG", "<fg #1cfc03>"),
+	("CRITICAL", "<fg #960000>"),
+	("TRACE", "<white>"),
+	("SUCCESS", "<fg #00ff22>"),
+)
+
 
-_ERROR_EVENTS_MAX = 500
-_error_events_lock = threading.Lock()
-_error_events: deque[dict[str, Any]] = deque(maxlen=_ERROR_EVENTS_MAX)
+# Error popup events live in a fixed ring indexed by event id. The popup sink
+# is the only writer (loguru runs it on its enqueue thread), so it fills the
+# slot first and then publishes the new id; readers need no lock and skip
+# any slot that was overwritten while they were reading.
+@dataclass(frozen=True, slots=True)
+class _PopupEvent:
+	"""One captured ERROR+ record; slotted to keep the ring compact."""
+	event_id: int
+	level: str
+	message: str
+
+
+_ERROR_EVENTS_MAX = 1024  # power of two
+_ERROR_EVENTS_MASK = _ERROR_EVENTS_MAX - 1
+_error_events: list[_PopupEvent | None] = [None] * _ERROR_EVENTS_MAX
 _error_event_id = 0
 
 
 def _error_popup_sink(message) -> None:
 	"""Capture ERROR+ records so UI sessions can show toast popups."""
 	global _error_event_id
-	record = message.record
-	level_name = str(record.get("level").name)
-	text = str(record.get("message") or "").strip()
-
-	exc = record.get("exception")
-	if exc and getattr(exc, "value", None):
-		exc_text = str(exc.value)
-		if exc_text:
-			text = f"{text} | {exc_text}" if text else exc_text
-
-	if not text:
-		text = "An unknown error was logged."
-
-	with _error_events_lock:
-		_error_event_id += 1
-		_error_events.append(
-			{
-				"id": _error_event_id,
-				"level": level_name,
-				"message": text,
-			}
-		)
+	try:
+		record = message.record
+		level_name = record["level"].name
+		msg = record["message"]
+		text = msg.strip() if isinstance(msg, str) else (str(msg).strip() if msg else "")
+
+		exc = record["exception"]
+		if exc is not None and exc.value is not None:
+			exc_text = str(exc.value)
+			if exc_text:
+				text = f"{text} | {exc_text}" if text else exc_text
+
+		if not text:
+			text = "An unknown error was logged."
+
+		event_id = _error_event_id + 1
+		_error_events[event_id & _ERROR_EVENTS_MASK] = _PopupEvent(event_id, level_name, text)
+		_error_event_id = event_id
+	except Exception:
+		# Registered with catch=False: never let a popup failure reach loguru.
+		try:
+			sys.stderr.write("Error popup sink failed:\n")
+			traceback.print_exc(file=sys.stderr)
+		except Exception:
+			pass
 
 
 def get_latest_error_popup_event_id() -> int:
-	with _error_events_lock:
-		return int(_error_event_id)
+	return _error_event_id
 
 
-def get_error_popup_events_since(last_seen_id: int) -> tuple[int, list[dict[str, Any]]]:
-	with _error_events_lock:
-		current = int(_error_event_id)
-		events = [evt for evt in _error_events if int(evt.get("id", 0)) > int(last_seen_id)]
+def get_error_popup_events_since(last_seen_id: int) -> tuple[int, list[_PopupEvent]]:
+	current = _error_event_id
+	first_id = max(int(last_seen_id), current - _ERROR_EVENTS_MAX) + 1
+	events: list[_PopupEvent] = []
+	for event_id in range(first_id, current + 1):
+		evt = _error_events[event_id & _ERROR_EVENTS_MASK]
+		if evt is not None and evt.event_id == event_id:
+			events.append(evt)
 	return current, events
 
 
@@ -97,6 +150,16 @@ def _install_global_exception_hooks() -> None:
 	threading.excepthook = _thread_hook
 
 
+_INT_LEVELS = {
+	logging.CRITICAL: "CRITICAL",
+	logging.ERROR: "ERROR",
+	logging.WARNING: "WARNING",
+	logging.INFO: "INFO",
+	logging.DEBUG: "DEBUG",
+}
+_VALID_LEVEL_NAMES = frozenset({"TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"})
+
+
 def _parse_level(level_value) -> str:
 	"""
 	Accepts:
@@ -105,18 +168,11 @@ def _parse_level(level_value) -> str:
 	Returns a Loguru level name.
 	"""
 	if isinstance(level_value, int):
-		mapping = {
-			logging.CRITICAL: "CRITICAL",
-			logging.ERROR: "ERROR",
-			logging.WARNING: "WARNING",
-			logging.INFO: "INFO",
-			logging.DEBUG: "DEBUG",
-		}
-		return mapping.get(level_value, "INFO")
+		return _INT_LEVELS.get(level_value, "INFO")
 
 	if isinstance(level_value, str):
 		val = level_value.strip().upper()
-		if val in ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"):
+		if val in _VALID_LEVEL_NAMES:
 			return val
 
 	return "INFO"
@@ -141,8 +197,7 @@ def setup_logging(
 	configured_file_level = file_level if file_level is not None else os.getenv("LOG_FILE_LEVEL", DEFAULT_FILE_LEVEL)
 	resolved_file_level = _parse_level(configured_file_level)
 
-	if not os.path.exists(log_dir):
-		os.makedirs(log_dir)
+	os.makedirs(log_dir, exist_ok=True)
 
 	log_path = os.path.join(log_dir, f"{app_name}.log")
 
@@ -151,36 +206,18 @@ def setup_logging(
 	# Configure sinks similar to your `logger.configure(**config)` pattern
 	logger.configure(
 		handlers=[
-			{
-				"sink": sys.stdout,
-				"format": LOG_FORMAT,
-				"colorize": True,
-				"level": console_level,
-			},
-			{
-				"sink": log_path,
-				"format": LOG_FORMAT,
-				"rotation": "10 MB",
-				"compression": "zip",
-				"retention": 50,      # keep 50 rotated files
-				"colorize": False,
-				"level": resolved_file_level,
-			},
+			{**_CONSOLE_HANDLER, "sink": sys.stdout, "level": console_level},
+			{**_FILE_HANDLER, "sink": log_path, "level": resolved_file_level},
 		]
 	)
 
 	# In-memory sink for UI error popups (all ERROR/CRITICAL records).
-	logger.add(_error_popup_sink, level="ERROR", catch=True, enqueue=True, format="{message}")
+	logger.add(_error_popup_sink, level="ERROR", catch=False, enqueue=True, format="{message}")
 	_install_global_exception_hooks()
 
 	# Define/override level colors (Loguru default exists, but you want explicit)
-	logger.level("ERROR", color="<fg #ff0000>")
-	logger.level("WARNING", color="<fg #f9ff5c>")
-	logger.level("INFO", color="<cyan>")
-	logger.level("DEBUG", color="<fg #1cfc03>")
-	logger.level("CRITICAL", color="<fg #960000>")
-	logger.level("TRACE", color="<white>")
-	logger.level("SUCCESS", color="<fg #00ff22>")
+	for level_name, color in _LEVEL_COLORS:
+		logger.level(level_name, color=color)
 
 	logger.info(
 		f"[setup_logging] - logger_initialized - app_name={app_name} console_level={console_level} file_level={resolved_file_level} log_path={log_path}"
@@ -191,30 +228,62 @@ def get_log_file_path(app_name: str = "app", log_dir: str = "log") -> str:
 	return os.path.join(log_dir, f"{app_name}.log")
 
 
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
 def read_log_tail(*, app_name: str = "app", log_dir: str = "log", max_lines: int = 400) -> str:
 	path = get_log_file_path(app_name=app_name, log_dir=log_dir)
 	if not os.path.exists(path):
 		return f"Log file not found: {path}"
 	try:
-		with open(path, "r", encoding="utf-8", errors="replace") as f:
-			lines = f.readlines()
-		return "".join(lines[-max(1, int(max_lines)):])
+		wanted = max(1, int(max_lines))
+		# Read fixed-size blocks backwards from EOF until enough lines are in.
+		blocks: list[bytes] = []
+		newlines = 0
+		with open(path, "rb") as f:
+			pos = f.seek(0, os.SEEK_END)
+			while pos > 0 and newlines <= wanted:
+				step = min(_TAIL_BLOCK_SIZE, pos)
+				pos -= step
+				f.seek(pos)
+				block = f.read(step)
+				newlines += block.count(b"\n")
+				blocks.append(block)
+		text = b"".join(reversed(blocks)).decode("utf-8", errors="replace").replace("\r\n", "\n")
+		# Split on "\n" only, the same rule the block loop counted with; splitlines()
+		# would also break on \x0b, \x0c, \x1c-\x1e, \x85 and \u2028 inside messages.
+		lines = text.split("\n")
+		trailing_newline = text.endswith("\n")
+		if trailing_newline:
+			lines.pop()
+		tail = "\n".join(lines[-wanted:])
+		return tail + "\n" if trailing_newline else tail
 	except Exception as ex:
 		return f"Failed reading log file: {ex}"
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(component: str):
 	return logger.bind(component=component)
 
 
+_SCALAR_TYPES = frozenset({int, float, bool})
+
+
 def summarize_for_log(payload: Any, *, max_items: int = 10, max_text: int = 140) -> Any:
 	if payload is None:
 		return None
+	payload_type = type(payload)
+	# Scalars are kept as-is, so inside containers they log unquoted ({'a': 1}, not {'a': '1'}).
+	if payload_type in _SCALAR_TYPES:
+		return payload
+	if payload_type is str and len(payload) <= max_text:
+		return payload
 	if isinstance(payload, dict):
-		items = list(payload.items())[:max_items]
+		items = itertools.islice(payload.items(), max_items)
 		return {str(k): summarize_for_log(v, max_items=max_items, max_text=max_text) for k, v in items}
 	if isinstance(payload, (list, tuple, set)):
-		limited = list(payload)[:max_items]
+		limited = itertools.islice(payload, max_items)
 		return [summarize_for_log(v, max_items=max_items, max_text=max_text) for v in limited]
 	text = str(payload)
 	if len(text) > max_text:
@@ -224,14 +293,24 @@ def summarize_for_log(payload: Any, *, max_items: int = 10, max_text: int = 140)
 
 @contextmanager
 def log_timing(method_name: str, **context: Any):
-	start = time.perf_counter()
-	context_txt = " ".join([f"{k}={summarize_for_log(v)}" for k, v in context.items()])
-	logger.debug(f"[{method_name}] - start {context_txt}".strip())
+	start_ns = time.perf_counter_ns()
+	context_cache: list[str] = []
+
+	def _context_txt() -> str:
+		# Built on first use only, so filtered DEBUG lines cost no formatting.
+		if not context:
+			return ""
+		if not context_cache:
+			context_cache.append(" ".join(f"{k}={summarize_for_log(v)}" for k, v in context.items()))
+		return context_cache[0]
+
+	lazy_logger = logger.opt(lazy=True)
+	lazy_logger.debug("{}", lambda: f"[{method_name}] - start {_context_txt()}".strip())
 	try:
 		yield
-		duration_ms = round((time.perf_counter() - start) * 1000, 2)
-		logger.debug(f"[{method_name}] - end - duration_ms={duration_ms} {context_txt}".strip())
+		elapsed_ns = time.perf_counter_ns() - start_ns
+		lazy_logger.debug("{}", lambda: f"[{method_name}] - end - duration_ms={elapsed_ns / 1_000_000:.2f} {_context_txt()}".strip())
 	except Exception:
-		duration_ms = round((time.perf_counter() - start) * 1000, 2)
-		logger.exception(f"[{method_name}] - failed - duration_ms={duration_ms} {context_txt}".strip())
+		elapsed_ns = time.perf_counter_ns() - start_ns
+		logger.exception(f"[{method_name}] - failed - duration_ms={elapsed_ns / 1_000_000:.2f} {_context_txt()}".strip())
 		raise
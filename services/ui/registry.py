@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -101,7 +102,7 @@ VIEW_ACTIONS: dict[ViewName, tuple[UiActionName, ...]] = {
         UiActionName.FAIL,
         UiActionName.SCRAP,
     ),
-    ViewName.VIEW_ACTION_EXAMPLE: tuple(a for a in UiActionName),
+    ViewName.VIEW_ACTION_EXAMPLE: tuple(UiActionName),
 }
 
 
@@ -111,15 +112,33 @@ VIEW_EVENTS: dict[ViewName, tuple[UiEvent, ...]] = {
     ViewName.PACKAGING_NOX: (UiEvent.CLICK,),
     ViewName.VI_HOME: (UiEvent.CLICK,),
     ViewName.VI_FAILURE_CATALOGUE: (UiEvent.CLICK, UiEvent.SUBMIT),
-    ViewName.VIEW_ACTION_EXAMPLE: tuple(e for e in UiEvent),
+    ViewName.VIEW_ACTION_EXAMPLE: tuple(UiEvent),
 }
 
+# Set view of VIEW_ACTIONS for membership checks; the tuples above keep
+# declaration order for listing.
+VIEW_ACTIONS_SET: dict[ViewName, frozenset[UiActionName]] = {
+    view: frozenset(actions) for view, actions in VIEW_ACTIONS.items()
+}
+
+_ACTION_VALUES_BY_VIEW: dict[ViewName, list[str]] = {
+    view: [a.value for a in VIEW_ACTIONS.get(view, ())] for view in ViewName
+}
+
+# Every allowed (view, action, event) combination, so strict parsing is one probe.
+_VALID_TRIPLES: frozenset[tuple[ViewName, UiActionName, UiEvent]] = frozenset(
+    (view, action, event)
+    for view, actions in VIEW_ACTIONS.items()
+    for action in actions
+    for event in VIEW_EVENTS.get(view, ())
+)
+
 
 class ViewRegistryError(ValueError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewActionRef:
     view: str
     name: str
@@ -145,15 +164,20 @@ def _enum_from_value(
     strict: bool = True,
     default: str | None = None,
 ) -> str:
-    if isinstance(value, enum_cls):
+    value_type = type(value)
+    if value_type is enum_cls:
+        return value.value
+    if value_type is str:
+        raw = value.strip()
+    elif isinstance(value, enum_cls):
         return str(value.value)
-
-    raw = str(getattr(value, "value", value) or "").strip()
+    else:
+        raw = str(getattr(value, "value", value) or "").strip()
     if not raw and default is not None:
         raw = str(default or "").strip()
     if not raw:
         if strict:
-            raise ViewRegistryError("unknown %s '%s'" % (field_name, raw))
+            raise ViewRegistryError(f"unknown {field_name} '{raw}'")
         return ""
 
     # Accept dotted enum-like inputs such as "ViewName.CONTAINER_MANAGEMENT".
@@ -170,10 +194,14 @@ def _enum_from_value(
         return str(enum_cls(raw).value)
     except Exception:
         if strict:
-            raise ViewRegistryError("unknown %s '%s'" % (field_name, raw))
+            raise ViewRegistryError(f"unknown {field_name} '{raw}'")
         return raw
 
 
+def _raw_text(value: Any) -> str:
+    return str(getattr(value, "value", value) or "").strip()
+
+
 def parse_view_action(
     *,
     view: Any,
@@ -181,6 +209,12 @@ def parse_view_action(
     event: Any = UiEvent.CLICK,
     strict: bool = False,
 ) -> ViewActionRef:
+    # Results depend only on the raw strings, so the parsed ref is memoized on them.
+    return _parse_view_action_cached(_raw_text(view), _raw_text(name), _raw_text(event), bool(strict))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_view_action_cached(view: str, name: str, event: str, strict: bool) -> ViewActionRef:
     view_name = _enum_from_value(ViewName, view, "view", strict=strict)
     action_name = _enum_from_value(UiActionName, name, "action", strict=strict)
     event_name = _enum_from_value(
@@ -195,13 +229,14 @@ def parse_view_action(
         view_enum = ViewName(view_name)
         action_enum = UiActionName(action_name)
         event_enum = UiEvent(event_name)
-        if action_enum not in VIEW_ACTIONS.get(view_enum, ()):  # explicit non-reflective validation
-            raise ViewRegistryError(
-                "invalid action '%s' for view '%s'" % (action_name, view_name)
-            )
-        if event_enum not in VIEW_EVENTS.get(view_enum, ()):  # explicit non-reflective validation
+        if (view_enum, action_enum, event_enum) not in _VALID_TRIPLES:
+            # Slow path only to name the offending field.
+            if action_enum not in VIEW_ACTIONS_SET.get(view_enum, frozenset()):  # explicit non-reflective validation
+                raise ViewRegistryError(
+                    f"invalid action '{action_name}' for view '{view_name}'"
+                )
             raise ViewRegistryError(
-                "invalid event '%s' for view '%s'" % (event_name, view_name)
+                f"invalid event '{event_name}' for view '{view_name}'"
             )
     return ViewActionRef(view=view_name, name=action_name, event=event_name)
 
@@ -229,16 +264,30 @@ def to_view_action(
     return ref.to_legacy_dict()
 
 
+_WAIT_KEY: dict[str, str] = {v.value: f"view.wait.{v.value}" for v in ViewName}
+
+
 def view_wait_key(view: ViewName | str) -> str:
-    return "view.wait.%s" % str(getattr(view, "value", view) or "").strip()
+    # ViewName members hash like their values, so both hit the precomputed keys.
+    if isinstance(view, str):
+        key = _WAIT_KEY.get(view)
+        if key is not None:
+            return key
+    return f"view.wait.{str(getattr(view, 'value', view) or '').strip()}"
 
 
 def list_registry() -> dict[str, Any]:
+    # Callers get their own lists; the snapshot itself is never handed out.
     return {
-        "views": [v.value for v in ViewName],
-        "events": [e.value for e in UiEvent],
-        "actions": {
-            view.value: [a.value for a in VIEW_ACTIONS.get(view, tuple())]
-            for view in ViewName
-        },
+        "views": list(_REGISTRY_SNAPSHOT["views"]),
+        "events": list(_REGISTRY_SNAPSHOT["events"]),
+        "actions": {view: list(actions) for view, actions in _REGISTRY_SNAPSHOT["actions"].items()},
     }
+
+
+# The registry is static after import.
+_REGISTRY_SNAPSHOT: dict[str, Any] = {
+    "views": [v.value for v in ViewName],
+    "events": [e.value for e in UiEvent],
+    "actions": {view.value: _ACTION_VALUES_BY_VIEW[view] for view in ViewName},
+}
@@ -7,7 +7,7 @@ from services.ui.view_cmd import publish_view_cmd
 from services.ui.registry import UiActionName, UiEvent, ViewName, to_view_action
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StandardViewAction:
     name: str
     description: str
@@ -15,7 +15,7 @@ class StandardViewAction:
     event: str = UiEvent.CLICK.value
 
 
-STANDARD_ACTIONS: list[StandardViewAction] = [
+STANDARD_ACTIONS: tuple[StandardViewAction, ...] = (
     StandardViewAction(name="start", description="Start processing or cycle.", icon="play_arrow"),
     StandardViewAction(name="stop", description="Stop processing or cycle.", icon="stop"),
     StandardViewAction(name="reset", description="Reset local or process state.", icon="restart_alt"),
@@ -34,8 +34,7 @@ STANDARD_ACTIONS: list[StandardViewAction] = [
     StandardViewAction(name="pass", description="Confirm pass result.", icon="task_alt"),
     StandardViewAction(name="fail", description="Confirm fail/recheck result.", icon="warning"),
     StandardViewAction(name="scrap", description="Confirm scrap result.", icon="delete_forever"),
-]
-
+)
 
 def make_action_event(
     view: ViewName | str,
@@ -63,8 +62,8 @@ def publish_standard_view_action(
     source_id: str | None = None,
 ) -> dict[str, str]:
     action = make_action_event(view=view, name=name, event=event)
-    merged_extra = dict(extra or {})
-    merged_extra.setdefault("action", action)
+    # Built fresh here and handed to publish_view_cmd without a second copy.
+    merged_extra = {"action": action, **extra} if extra else {"action": action}
 
     publish_view_cmd(
         worker_bus=worker_bus,
@@ -76,5 +75,6 @@ def publish_standard_view_action(
         open_wait=open_wait,
         extra=merged_extra,
         source_id=source_id,
+        copy_extra=False,
     )
     return action
@@ -1,12 +1,13 @@
 # services/ui/view_cmd.py
 from __future__ import annotations
 
+import sys
 import time
-import queue
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
-from nicegui import ui
+from nicegui import core, ui
 from loguru import logger
 
 from services.worker_topics import WorkerTopics
@@ -20,11 +21,25 @@ from services.ui.registry import (
 )
 
 
+# Top-level bus dict keys owned by ViewCommand itself; everything else is payload.
+_RESERVED_BUS_KEYS: frozenset[str] = frozenset({"view", "cmd_key", "action", "event_id", "wait_modal_key", "source_id"})
+
+_ENUM_TYPES = frozenset((ViewName, UiActionName, UiEvent))
+_ENUM_VALUE: dict[Any, str] = {m: m.value for cls in _ENUM_TYPES for m in cls}
+
+_VIEW_CMD_TOPIC: dict[str, str] = {v.value: f"view.cmd.{v.value}" for v in ViewName}
+
+
 def _raw_value(value: Any) -> str:
+	value_type = type(value)
+	if value_type is str:
+		return value
+	if value_type in _ENUM_TYPES:
+		return _ENUM_VALUE[value]
 	return str(getattr(value, "value", value))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewAction:
 	view: ViewName | str
 	name: UiActionName | str
@@ -38,7 +53,7 @@ class ViewAction:
 		}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewCommand:
 	action: ViewAction
 	event_id: int
@@ -56,29 +71,35 @@ class ViewCommand:
 		wait_key: str | None = None,
 		source_id: str | None = None,
 		payload: dict[str, Any] | None = None,
+		copy_payload: bool = True,
 	) -> "ViewCommand":
 		return cls(
 			action=ViewAction(view=_raw_value(view), name=_raw_value(name), event=_raw_value(event)),
 			event_id=int(time.time_ns()),
 			wait_modal_key=str(wait_key) if wait_key else None,
 			source_id=str(source_id or "ui"),
-			payload=dict(payload or {}),
+			payload=(dict(payload) if copy_payload else payload) if payload else {},
 		)
 
 	def to_bus_dict(self, cmd_key: str) -> dict[str, Any]:
-		return {
-			"view": _raw_value(self.action.view),
+		return self._build_bus_payload(cmd_key, include_source_id=True)
+
+	def _build_bus_payload(self, cmd_key: str, *, include_source_id: bool) -> dict[str, Any]:
+		action = self.action.to_dict()
+		data: dict[str, Any] = {
+			"view": action["view"],
 			"cmd_key": cmd_key,
-			"action": {
-				"view": _raw_value(self.action.view),
-				"name": _raw_value(self.action.name),
-				"event": _raw_value(self.action.event),
-			},
+			"action": action,
 			"event_id": self.event_id,
 			"wait_modal_key": self.wait_modal_key,
-			"source_id": self.source_id,
-			**self.payload,
 		}
+		if include_source_id:
+			data["source_id"] = self.source_id
+		if self.payload:
+			data.update(self.payload)
+			if not include_source_id:
+				data.pop("source_id", None)
+		return data
 
 	def to_cmd_value_payload(self) -> dict[str, Any]:
 		cmd_payload: dict[str, Any] = {
@@ -92,14 +113,13 @@ class ViewCommand:
 		return cmd_payload
 
 	def to_view_topic_payload(self, *, cmd_key: str) -> dict[str, Any]:
-		return self.to_bus_dict(cmd_key=str(cmd_key))
+		"""Payload for the view.cmd.<view> topic; source_id travels as the publish() argument instead."""
+		return self._build_bus_payload(str(cmd_key), include_source_id=False)
 
 	@classmethod
 	def from_bus_dict(cls, data: dict[str, Any]) -> "ViewCommand":
 		action = data.get("action", {}) or {}
-		payload = dict(data)
-		for k in ("view", "cmd_key", "action", "event_id", "wait_modal_key", "source_id"):
-			payload.pop(k, None)
+		payload = {k: v for k, v in data.items() if k not in _RESERVED_BUS_KEYS}
 		return cls(
 			action=ViewAction(
 				view=action.get("view") or data.get("view"),
@@ -124,16 +144,24 @@ def parse_view_cmd_payload(payload: Any, *, strict: bool = False) -> ViewCommand
 	action_raw = payload.get("action")
 	if not isinstance(action_raw, dict):
 		return None
-	view = str(action_raw.get("view") or payload.get("view") or "").strip()
-	name = str(action_raw.get("name") or "").strip()
-	event = str(action_raw.get("event") or UiEvent.CLICK.value).strip() or UiEvent.CLICK.value
+	view_raw = action_raw.get("view") or payload.get("view")
+	name_raw = action_raw.get("name")
+	if not view_raw or not name_raw:
+		return None
+	view = str(view_raw).strip()
+	name = str(name_raw).strip()
 	if not view or not name:
 		return None
+	event = str(action_raw.get("event") or UiEvent.CLICK.value).strip() or UiEvent.CLICK.value
+	# Interned and written back into the action below, so the ViewCommand carries
+	# stripped strings that compare against registry values on identity.
+	view, name, event = sys.intern(view), sys.intern(name), sys.intern(event)
 	try:
 		event_id = int(payload.get("event_id") or 0)
 	except Exception:
 		event_id = 0
 	data = dict(payload)
+	data["action"] = {**action_raw, "view": view, "name": name, "event": event}
 	data["event_id"] = event_id
 	data["source_id"] = str(payload.get("source_id", "ui"))
 	wait_modal_key = payload.get("wait_modal_key")
@@ -150,7 +178,6 @@ def parse_view_cmd_payload_or_error(payload: Any) -> ViewCommand:
 	return cmd
 
 
-
 def install_wait_dialog(
 	*,
 	ctx,
@@ -163,12 +190,15 @@ def install_wait_dialog(
 	"""
 	Install a standard wait dialog that opens on VALUE_CHANGED(open) and closes on TOPIC_MODAL_CLOSE.
 
+	Signals are drained on the UI event loop as soon as they are published; a 1 s
+	timer remains as a safety net. Without a running loop it falls back to 10 Hz polling.
+
 	Returns:
 	{
 		"open": callable,
 		"close": callable,
 		"subs": [sub_wait_open, sub_wait_close],
-		"timers": [timer_open, timer_close],
+		"timers": [timer_fallback] (or [timer_open, timer_close] when polling),
 	}
 	"""
 	ui.add_head_html("""
@@ -183,8 +213,15 @@ def install_wait_dialog(
 </style>
 """)
 
-	sub_wait_close = worker_bus.subscribe(WorkerTopics.TOPIC_MODAL_CLOSE)
-	sub_wait_open = worker_bus.subscribe(WorkerTopics.VALUE_CHANGED)
+	target_key = sys.intern(str(wait_key or "").strip())
+
+	def _is_target_key(key: Any) -> bool:
+		# Identity/equality first; strip only str keys that did not match exactly.
+		if key is target_key or key == target_key:
+			return True
+		if not key:
+			return not target_key
+		return type(key) is str and key.strip() == target_key
 
 	wait_state = {"open": False}
 	wait_text_refs = {"title": None, "message": None}
@@ -214,55 +251,95 @@ def install_wait_dialog(
 		wait_state["open"] = False
 		wait_dialog.close()
 
+	default_title = str(title)
+	default_message = str(message)
+
+	def _on_wait_open(value: dict) -> None:
+		_set_wait_dialog_text(
+			title_text=str(value.get("title") or default_title),
+			message_text=str(value.get("message") or default_message),
+		)
+		_open_wait_dialog()
+
+	def _on_wait_close(_value: dict) -> None:
+		_close_wait_dialog()
+
+	wait_actions: dict[str, Callable[[dict], None]] = {"open": _on_wait_open, "close": _on_wait_close}
+
 	def _drain_wait_open_signal() -> None:
-		while True:
-			try:
-				msg = sub_wait_open.queue.get_nowait()
-			except queue.Empty:
-				break
+		for msg in sub_wait_open.drain_all():
 			payload = getattr(msg, "payload", None) or {}
 			if not isinstance(payload, dict):
 				continue
-			key = str(payload.get("key") or "").strip()
-			if key != str(wait_key or "").strip():
+			if not _is_target_key(payload.get("key")):
 				continue
 			value = payload.get("value")
 			if not isinstance(value, dict):
 				continue
-			action = str(value.get("action") or "").strip().lower()
-			if action == "open":
-				_set_wait_dialog_text(
-					title_text=str(value.get("title") or title),
-					message_text=str(value.get("message") or message),
-				)
-				_open_wait_dialog()
-			elif action == "close":
-				_close_wait_dialog()
+			action = value.get("action")
+			# Exact lowercase strings hit the table directly; anything else is normalized first.
+			handler = wait_actions.get(action) if type(action) is str else None
+			if handler is None and action:
+				handler = wait_actions.get(str(action).strip().lower())
+			if handler is not None:
+				handler(value)
 
 	def _drain_wait_close_signal() -> None:
-		while True:
-			try:
-				msg = sub_wait_close.queue.get_nowait()
-			except queue.Empty:
-				break
+		for msg in sub_wait_close.drain_all():
 			payload = getattr(msg, "payload", None) or {}
 			if not isinstance(payload, dict):
 				continue
 			if bool(payload.get("close_active", False)):
 				_close_wait_dialog()
 				continue
-			key = str(payload.get("key") or "").strip()
-			if key == str(wait_key or "").strip():
+			if _is_target_key(payload.get("key")):
 				_close_wait_dialog()
 
-	timer_open = (add_timer or ui.timer)(0.1, _drain_wait_open_signal)
-	timer_close = (add_timer or ui.timer)(0.1, _drain_wait_close_signal)
+	def _drain_wait_signals() -> None:
+		drain_scheduled.clear()
+		if wait_dialog.is_deleted:
+			return
+		_drain_wait_open_signal()
+		_drain_wait_close_signal()
+
+	loop = core.loop if core.is_loop_running() else None
+	drain_scheduled = threading.Event()
+
+	def _schedule_drain() -> None:
+		# Publisher thread: coalesce bursts into one drain callback on the UI loop.
+		if drain_scheduled.is_set():
+			return
+		drain_scheduled.set()
+		loop.call_soon_threadsafe(_drain_wait_signals)
+
+	def _on_value_changed(msg: Any) -> None:
+		# VALUE_CHANGED is the busiest topic; only wake the loop for this dialog's key.
+		# Anything else queued is picked up by the fallback timer.
+		payload = getattr(msg, "payload", None)
+		if isinstance(payload, dict) and _is_target_key(payload.get("key")):
+			_schedule_drain()
+
+	def _on_modal_close(_msg: Any) -> None:
+		_schedule_drain()
+
+	# Subscribed last so the hooks never fire before the handlers above exist.
+	fast_path = loop is not None
+	sub_wait_close = worker_bus.subscribe(WorkerTopics.TOPIC_MODAL_CLOSE, on_message=_on_modal_close if fast_path else None)
+	sub_wait_open = worker_bus.subscribe(WorkerTopics.VALUE_CHANGED, on_message=_on_value_changed if fast_path else None)
+
+	if fast_path:
+		timers = [(add_timer or ui.timer)(1.0, _drain_wait_signals)]
+	else:
+		timers = [
+			(add_timer or ui.timer)(0.1, _drain_wait_open_signal),
+			(add_timer or ui.timer)(0.1, _drain_wait_close_signal),
+		]
 
 	return {
 		"open": _open_wait_dialog,
 		"close": _close_wait_dialog,
 		"subs": [sub_wait_open, sub_wait_close],
-		"timers": [timer_open, timer_close],
+		"timers": timers,
 	}
 
 
@@ -277,11 +354,14 @@ def publish_view_cmd(
 	open_wait: Optional[Callable[[], Any]] = None,
 	extra: Optional[dict] = None,
 	source_id: Optional[str] = None,
+	copy_extra: bool = True,
 ) -> None:
 	"""
 	Publish the standard command payload to:
 	- WorkerTopics.VALUE_CHANGED with key=cmd_key (legacy)
 	- topic "view.cmd.<view>" (new, wildcard-friendly)
+
+	Pass copy_extra=False only when `extra` is a fresh dict the caller hands over.
 	"""
 	publish_fn = getattr(worker_bus, "publish", None)
 	if not callable(publish_fn):
@@ -291,15 +371,19 @@ def publish_view_cmd(
 	if callable(open_wait):
 		open_wait()
 
-	source_id = str(source_id or view or "")
-	wait_key_value = str(wait_key or view_wait_key(view)).strip()
+	# Normalize once; create() and both publishes reuse these strings.
+	view_str = _raw_value(view) if view else ""
+	cmd_key_str = str(cmd_key)
+	source_id = str(source_id) if source_id else view_str
+	wait_key_value = str(wait_key or view_wait_key(view_str)).strip()
 	msg = ViewCommandMessage.create(
-		view=str(view),
-		name=str(name),
-		event=str(event),
+		view=view_str,
+		name=name,
+		event=event,
 		wait_key=wait_key_value or None,
 		source_id=source_id,
 		payload=extra if isinstance(extra, dict) else None,
+		copy_payload=copy_extra,
 	)
 	payload = msg.to_cmd_value_payload()
 
@@ -307,14 +391,13 @@ def publish_view_cmd(
 		topic=WorkerTopics.VALUE_CHANGED,
 		source="ui",
 		source_id=source_id,
-		key=str(cmd_key),
+		key=cmd_key_str,
 		value=payload,
 	)
 
-	view_payload = msg.to_view_topic_payload(cmd_key=str(cmd_key))
-	view_payload.pop("source_id", None)
+	view_payload = msg.to_view_topic_payload(cmd_key=cmd_key_str)
 	publish_fn(
-		topic="view.cmd.%s" % str(view),
+		topic=_VIEW_CMD_TOPIC.get(view_str) or f"view.cmd.{view_str}",
 		source="ui",
 		source_id=source_id,
 		**view_payload,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import itertools
 import queue
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, is_dataclass, asdict
 from enum import StrEnum
 from typing import Any, Callable, DefaultDict, Union
@@ -14,58 +15,64 @@ Topic = Union[str, StrEnum]
 
 
 # ---------- events delivered to UI-side subscribers ----------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UiBusMessage:
     topic: str
     payload: dict[str, Any]
 
 
 # ---------- worker -> UI messages (bridge inbox) ----------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Patch:
     """Update one attribute on ctx.state: setattr(state, key, value)."""
     key: str
     value: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class PatchMany:
+    """Update several attributes on ctx.state, publishing one state.<key> event per key."""
+    values: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
 class ReplaceState:
     """Update multiple attributes on ctx.state (useful for initial sync/resync)."""
     values: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Notify:
     """Show a NiceGUI notification."""
     message: str
     type: str = "info"  # "positive" | "negative" | "warning" | "info"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Call:
     """Call a function on the UI thread."""
     fn: Callable[[], None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorEvent:
     error_id: str
     source: str
     message: str
     details: str = ""
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequestUiState:
     """Worker requests the UI thread to publish a full ui.state snapshot."""
     pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorResolvedEvent:
     """Worker reports that an active error is resolved and should be removed."""
     error_id: str
 
 
-UiMsg = Patch | ReplaceState | Notify | Call | ErrorEvent | ErrorResolvedEvent | RequestUiState
+UiMsg = Patch | PatchMany | ReplaceState | Notify | Call | ErrorEvent | ErrorResolvedEvent | RequestUiState
 
 
 # ---------- subscriptions ----------
@@ -114,6 +121,7 @@ class UiBridge:
 
     Worker API (thread-safe):
       - emit_patch(key, value)
+      - emit_patch_many({...})
       - emit_replace_state({...})
       - emit_notify(...)
       - emit_call(...)
@@ -132,43 +140,61 @@ class UiBridge:
     """
 
     def __init__(self) -> None:
-        self._outbox: "queue.Queue[UiMsg]" = queue.Queue()
+        # Worker threads append under the lock; flush() takes a whole batch in one hold.
+        self._outbox: deque[UiMsg] = deque()
+        self._outbox_lock = threading.Lock()
         self._dirty = threading.Event()
         self._stop = threading.Event()
 
         self._sub_lock = threading.Lock()
         self._subs: DefaultDict[str, list["queue.Queue[UiBusMessage]"]] = defaultdict(list)
         self._prefix_subs: DefaultDict[str, list["queue.Queue[UiBusMessage]"]] = defaultdict(list)
+        # Distinct prefix lengths in _prefix_subs, so delivery probes topic[:n] per length
+        # instead of calling startswith() on every wildcard subscription.
+        self._prefix_lengths: tuple[int, ...] = ()
+
+        # flush() dispatch: exact message type -> handler(ctx, msg)
+        self._handlers: dict[type, Callable[[Any, Any], None]] = {
+            Patch: self._handle_patch,
+            PatchMany: self._handle_patch_many,
+            ReplaceState: self._handle_replace_state,
+            Notify: self._handle_notify,
+            Call: self._handle_call,
+            ErrorEvent: self._handle_error,
+            ErrorResolvedEvent: self._handle_error_resolved,
+            RequestUiState: self._handle_request_ui_state,
+        }
 
     # ----- worker -> UI (thread-safe enqueue) -----
-    def emit_patch(self, key: str, value: Any) -> None:
-        self._outbox.put(Patch(key, value))
+    def _enqueue(self, msg: UiMsg) -> None:
+        with self._outbox_lock:
+            self._outbox.append(msg)
         self._dirty.set()
 
+    def emit_patch(self, key: str, value: Any) -> None:
+        self._enqueue(Patch(key, value))
+
+    def emit_patch_many(self, values: dict[str, Any]) -> None:
+        self._enqueue(PatchMany(dict(values)))
+
     def emit_replace_state(self, values: dict[str, Any]) -> None:
-        self._outbox.put(ReplaceState(values))
-        self._dirty.set()
+        self._enqueue(ReplaceState(values))
 
     def emit_notify(self, message: str, type: str = "info") -> None:
-        self._outbox.put(Notify(message, type))
-        self._dirty.set()
+        self._enqueue(Notify(message, type))
 
     def emit_call(self, fn: Callable[[], None]) -> None:
-        self._outbox.put(Call(fn))
-        self._dirty.set()
+        self._enqueue(Call(fn))
 
     def emit_error(self, *, error_id: str, source: str, message: str, details: str = "") -> None:
-        self._outbox.put(ErrorEvent(error_id, source, message, details))
-        self._dirty.set()
+        self._enqueue(ErrorEvent(error_id, source, message, details))
 
     def emit_error_resolved(self, *, error_id: str) -> None:
-        self._outbox.put(ErrorResolvedEvent(error_id=error_id))
-        self._dirty.set()
+        self._enqueue(ErrorResolvedEvent(error_id=error_id))
 
     def request_ui_state(self) -> None:
         """Worker thread: ask UI thread to publish full ui.state snapshot."""
-        self._outbox.put(RequestUiState())
-        self._dirty.set()
+        self._enqueue(RequestUiState())
 
     # ----- lifecycle -----
     def stop(self) -> None:
@@ -192,6 +218,7 @@ class UiBridge:
             if topic_str.endswith("*"):
                 prefix = topic_str[:-1]
                 self._prefix_subs[prefix].append(q)
+                self._reindex_prefixes()
             else:
                 self._subs[topic_str].append(q)
 
@@ -224,6 +251,7 @@ class UiBridge:
                     return
                 if not lst:
                     self._prefix_subs.pop(prefix, None)
+                    self._reindex_prefixes()
                 return
 
             lst = self._subs.get(topic)
@@ -236,6 +264,10 @@ class UiBridge:
             if not lst:
                 self._subs.pop(topic, None)
 
+    def _reindex_prefixes(self) -> None:
+        # Caller holds _sub_lock.
+        self._prefix_lengths = tuple(sorted({len(p) for p in self._prefix_subs}))
+
     # ----- UI thread flush -----
     def flush(self, ctx: Any, *, max_items: int = 200) -> None:
         """
@@ -249,64 +281,89 @@ class UiBridge:
 
         self._dirty.clear()
 
-        processed = 0
-        while processed < max_items:
+        batch, more_pending = self._drain_outbox(max_items)
+        handlers = self._handlers
+        for i, msg in enumerate(batch):
+            handler = handlers.get(type(msg))
+            if handler is None:
+                continue
             try:
-                msg = self._outbox.get_nowait()
-            except queue.Empty:
-                break
+                handler(ctx, msg)
+            except BaseException:
+                # Leave the unprocessed rest queued for the next tick, as before.
+                self._requeue_front(list(itertools.islice(batch, i + 1, None)))
+                raise
 
-            if isinstance(msg, Patch):
-                self._apply_patch(ctx, msg.key, msg.value)
-
-            elif isinstance(msg, ReplaceState):
-                self._apply_replace_state(ctx, msg.values)
+        if more_pending:
+            self._dirty.set()
 
-            elif isinstance(msg, Notify):
-                ui.notify(msg.message, type=msg.type)
-                # optional event for listeners
-                self._deliver_to_subscribers(UiBusMessage("ui.notify", {"message": msg.message, "type": msg.type}))
+    def _drain_outbox(self, max_items: int) -> tuple[list[UiMsg] | deque[UiMsg], bool]:
+        """Take up to max_items queued messages under one lock hold; also report whether more remain."""
+        with self._outbox_lock:
+            outbox = self._outbox
+            if len(outbox) <= max_items:
+                self._outbox = deque()
+                return outbox, False
+            return [outbox.popleft() for _ in range(max_items)], True
+
+    def _requeue_front(self, msgs: list[UiMsg]) -> None:
+        if not msgs:
+            return
+        with self._outbox_lock:
+            self._outbox.extendleft(reversed(msgs))
+        self._dirty.set()
 
-            elif isinstance(msg, Call):
-                try:
-                    msg.fn()
-                except Exception as e:
-                    ui.notify(f"UI call failed: {e}", type="negative")
-                    self._deliver_to_subscribers(UiBusMessage("ui.call_error", {"error": str(e)}))
-
-            elif isinstance(msg, ErrorEvent):
-                # Local import to avoid import-time cycles
-                from layout.errors_state import upsert_error
-
-                upsert_error(ctx, msg.error_id, source=msg.source, message=msg.message, details=msg.details)
-                self._deliver_to_subscribers(UiBusMessage("errors.upsert", {
-                    "error_id": msg.error_id,
-                    "source": msg.source,
-                    "message": msg.message,
-                    "details": msg.details,
-                }))
-                # Keep ctx.state summary in sync
-                self._sync_error_count(ctx)
-
-            elif isinstance(msg, ErrorResolvedEvent):
-                from layout.errors_state import resolve_error
-
-                resolve_error(ctx, msg.error_id)
-                self._deliver_to_subscribers(UiBusMessage("errors.resolved", {"error_id": msg.error_id}))
-                self._sync_error_count(ctx)
-
-            elif isinstance(msg, RequestUiState):
-                state = getattr(ctx, "state", None)
-                if state is None:
-                    continue
-                #full snapshot (dataclass-friendly)
-                payload = asdict(state)
-                self._deliver_to_subscribers(UiBusMessage("state", payload))
-
-            processed += 1
-
-        if not self._outbox.empty():
-            self._dirty.set()
+    # ----- flush handlers (UI thread) -----
+    def _handle_patch(self, ctx: Any, msg: Patch) -> None:
+        self._apply_patch(ctx, msg.key, msg.value)
+
+    def _handle_patch_many(self, ctx: Any, msg: PatchMany) -> None:
+        for k, v in msg.values.items():
+            self._apply_patch(ctx, k, v)
+
+    def _handle_replace_state(self, ctx: Any, msg: ReplaceState) -> None:
+        self._apply_replace_state(ctx, msg.values)
+
+    def _handle_notify(self, ctx: Any, msg: Notify) -> None:
+        ui.notify(msg.message, type=msg.type)
+        # optional event for listeners
+        self._deliver_to_subscribers(UiBusMessage("ui.notify", {"message": msg.message, "type": msg.type}))
+
+    def _handle_call(self, ctx: Any, msg: Call) -> None:
+        try:
+            msg.fn()
+        except Exception as e:
+            ui.notify(f"UI call failed: {e}", type="negative")
+            self._deliver_to_subscribers(UiBusMessage("ui.call_error", {"error": str(e)}))
+
+    def _handle_error(self, ctx: Any, msg: ErrorEvent) -> None:
+        # Local import to avoid import-time cycles
+        from layout.errors_state import upsert_error
+
+        upsert_error(ctx, msg.error_id, source=msg.source, message=msg.message, details=msg.details)
+        self._deliver_to_subscribers(UiBusMessage("errors.upsert", {
+            "error_id": msg.error_id,
+            "source": msg.source,
+            "message": msg.message,
+            "details": msg.details,
+        }))
+        # Keep ctx.state summary in sync
+        self._sync_error_count(ctx)
+
+    def _handle_error_resolved(self, ctx: Any, msg: ErrorResolvedEvent) -> None:
+        from layout.errors_state import resolve_error
+
+        resolve_error(ctx, msg.error_id)
+        self._deliver_to_subscribers(UiBusMessage("errors.resolved", {"error_id": msg.error_id}))
+        self._sync_error_count(ctx)
+
+    def _handle_request_ui_state(self, ctx: Any, msg: RequestUiState) -> None:
+        state = getattr(ctx, "state", None)
+        if state is None:
+            return
+        #full snapshot (dataclass-friendly)
+        payload = asdict(state)
+        self._deliver_to_subscribers(UiBusMessage("state", payload))
 
     def ui_publish_event(self, topic: Topic, **payload: Any) -> None:
         """UI thread: publish an event to UiBridge subscribers immediately.
@@ -354,8 +411,13 @@ class UiBridge:
             exact_targets = list(self._subs.get(msg.topic, ()))
 
             prefix_targets: list["queue.Queue[UiBusMessage]"] = []
-            for prefix, queues in self._prefix_subs.items():
-                if msg.topic.startswith(prefix):
+            topic = msg.topic
+            topic_len = len(topic)
+            for n in self._prefix_lengths:
+                if n > topic_len:
+                    break
+                queues = self._prefix_subs.get(topic[:n])
+                if queues:
                     prefix_targets.extend(queues)
 
         # de-dup queues (same queue can match exact + prefix)
@@ -368,8 +430,11 @@ class UiBridge:
             seen.add(qid)
             targets.append(q)
 
-        payload_summary = self._summarize_payload(msg.payload)
-        logger.trace(f"[_deliver_to_subscribers] - ui_bus_message - topic={msg.topic} targets={len(targets)} payload={payload_summary}")
+        # Lazy: the payload summary is only built when a TRACE sink is active.
+        logger.opt(lazy=True).trace(
+            "{}",
+            lambda: f"[_deliver_to_subscribers] - ui_bus_message - topic={msg.topic} targets={len(targets)} payload={self._summarize_payload(msg.payload)}",
+        )
 
         for q in targets:
             q.put(msg)
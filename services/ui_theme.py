@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+from typing import Any
+
 from nicegui import ui
 
 from services.app_config import AppConfig
@@ -11,42 +14,8 @@ def _active_palette_name(cfg: AppConfig) -> str:
     return theme.dark_palette if is_dark else theme.light_palette
 
 
-def get_theme_palette(cfg: AppConfig) -> dict[str, str]:
-    theme = cfg.ui.theme
-    palette_name = _active_palette_name(cfg)
-    palette = theme.palettes.get(palette_name, {})
-    return {str(k): str(v) for k, v in palette.items()}
-
-
-def get_theme_color(cfg: AppConfig, key: str, fallback: str) -> str:
-    palette = get_theme_palette(cfg)
-    return str(palette.get(key, fallback))
-
-
-def _css_variables_block(palette: dict[str, str]) -> str:
-    rows = []
-    for key, value in sorted(palette.items()):
-        rows.append(f"--{key}: {value};")
-    return "\n".join(rows)
-
-
-def apply_ui_theme(cfg: AppConfig) -> None:
-    palette = get_theme_palette(cfg)
-
-    ui.colors(
-        primary=palette.get("primary", "#3b82f6"),
-        secondary=palette.get("secondary", "#0ea5e9"),
-        accent=palette.get("accent", "#22c55e"),
-        positive=palette.get("positive", "#16a34a"),
-        negative=palette.get("negative", "#dc2626"),
-        warning=palette.get("warning", "#f59e0b"),
-        info=palette.get("info", "#0284c7"),
-    )
-    ui.dark_mode(bool(getattr(cfg.ui.navigation, "dark_mode", False)))
-
-    css_vars = _css_variables_block(palette)
-    ui.add_head_html(
-        """
+# Static theme stylesheet; only the :root variable block is substituted.
+_CSS_TEMPLATE: str = """
         <style>
             :root {
         %s
@@ -164,5 +133,73 @@ def apply_ui_theme(cfg: AppConfig) -> None:
             }
         </style>
         """
-        % css_vars
+
+
+# Single-slot memo of the active palette: (theme object, palette name, version, palette).
+# Palettes are edited in place by the settings page, which bumps the version.
+_PALETTE_CACHE: tuple[Any, str, int, dict[str, str]] | None = None
+_THEME_VERSION = 0
+
+
+def invalidate_theme_cache() -> None:
+    """Call after mutating cfg.ui.theme in place so the next lookup rebuilds the palette."""
+    global _THEME_VERSION
+    _THEME_VERSION += 1
+
+
+def _active_palette(cfg: AppConfig) -> dict[str, str]:
+    # Shared cached dict; callers must not mutate it.
+    global _PALETTE_CACHE
+    theme = cfg.ui.theme
+    palette_name = _active_palette_name(cfg)
+    cached = _PALETTE_CACHE
+    if cached is not None and cached[0] is theme and cached[1] == palette_name and cached[2] == _THEME_VERSION:
+        return cached[3]
+    palette = theme.palettes.get(palette_name, {})
+    result = {str(k): str(v) for k, v in palette.items()}
+    _PALETTE_CACHE = (theme, palette_name, _THEME_VERSION, result)
+    return result
+
+
+def get_theme_palette(cfg: AppConfig) -> dict[str, str]:
+    return dict(_active_palette(cfg))
+
+
+def get_theme_color(cfg: AppConfig, key: str, fallback: str) -> str:
+    palette = _active_palette(cfg)
+    return str(palette.get(key, fallback))
+
+
+def _css_variables_block(palette: dict[str, str]) -> str:
+    return _css_variables_block_cached(frozenset(palette.items()))
+
+
+@functools.lru_cache(maxsize=8)
+def _css_variables_block_cached(items: frozenset[tuple[str, str]]) -> str:
+    rows = []
+    for key, value in sorted(items):
+        rows.append(f"--{key}: {value};")
+    return "\n".join(rows)
+
+
+@functools.lru_cache(maxsize=8)
+def _theme_head_html(css_vars: str) -> str:
+    return _CSS_TEMPLATE % css_vars
+
+
+def apply_ui_theme(cfg: AppConfig) -> None:
+    palette = _active_palette(cfg)
+
+    ui.colors(
+        primary=palette.get("primary", "#3b82f6"),
+        secondary=palette.get("secondary", "#0ea5e9"),
+        accent=palette.get("accent", "#22c55e"),
+        positive=palette.get("positive", "#16a34a"),
+        negative=palette.get("negative", "#dc2626"),
+        warning=palette.get("warning", "#f59e0b"),
+        info=palette.get("info", "#0284c7"),
     )
+    ui.dark_mode(bool(getattr(cfg.ui.navigation, "dark_mode", False)))
+
+    css_vars = _css_variables_block(palette)
+    ui.add_head_html(_theme_head_html(css_vars))
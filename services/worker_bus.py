@@ -4,7 +4,7 @@ import fnmatch
 import queue
 import threading
 from dataclasses import dataclass
-from typing import Any, DefaultDict, Optional, Union, List, Tuple
+from typing import Any, Callable, DefaultDict, Optional, Union, List, Tuple
 from collections import defaultdict
 from loguru import logger
 from services.worker_topics import WorkerTopics
@@ -21,6 +21,34 @@ class BusMessage:
 	source_id: str
 
 
+def drain_queue(q: "queue.Queue[Any]", max_items: Optional[int] = None) -> List[Any]:
+	"""Pop everything (or at most max_items) from an unbounded queue.Queue under one mutex hold."""
+	with q.mutex:
+		items = q.queue
+		if not items:
+			return []
+		if max_items is None or max_items >= len(items):
+			out = list(items)
+			items.clear()
+			return out
+		return [items.popleft() for _ in range(max_items)]
+
+
+class _HookedQueue(queue.Queue):
+	"""Subscriber queue that calls on_message(msg) on the publishing thread right after each put."""
+
+	def __init__(self, on_message: Callable[[BusMessage], None]) -> None:
+		super().__init__()
+		self._on_message = on_message
+
+	def put(self, item: BusMessage, block: bool = True, timeout: Optional[float] = None) -> None:
+		super().put(item, block, timeout)
+		try:
+			self._on_message(item)
+		except Exception:
+			logger.exception("Subscription on_message callback failed")
+
+
 class Subscription:
 	"""Handle returned by WorkerBus.subscribe(); call close() to unsubscribe."""
 
@@ -31,6 +59,10 @@ class Subscription:
 		self._is_pattern = is_pattern
 		self._closed = False
 
+	def drain_all(self) -> List[BusMessage]:
+		"""Return and remove all queued messages in one lock acquisition."""
+		return drain_queue(self.queue)
+
 	def close(self) -> None:
 		if self._closed:
 			return
@@ -53,6 +85,10 @@ class MultiSubscription:
 	def topics(self) -> List[Topic]:
 		return [s.topic for s in self._subs]
 
+	def drain_all(self) -> List[BusMessage]:
+		"""Return and remove all queued messages in one lock acquisition."""
+		return drain_queue(self.queue)
+
 	def close(self) -> None:
 		if self._closed:
 			return
@@ -104,8 +140,19 @@ class WorkerBus:
 		self,
 		topic: Topic,
 		q: Optional["queue.Queue[BusMessage]"] = None,
+		on_message: Optional[Callable[[BusMessage], None]] = None,
 	) -> Subscription:
-		if q is None:
+		"""
+		Subscribe to an exact topic or a glob pattern.
+
+		on_message, if given, is called on the publishing thread after each message is
+		queued; it must be cheap and thread-safe (e.g. schedule a drain on the UI loop).
+		"""
+		if on_message is not None:
+			if q is not None:
+				raise ValueError("on_message cannot be combined with a caller-provided queue")
+			q = _HookedQueue(on_message)
+		elif q is None:
 			q = queue.Queue()
 
 		topic_str = self._topic_to_str(topic)
@@ -123,10 +170,15 @@ class WorkerBus:
 		self,
 		topics: List[Topic],
 		q: Optional["queue.Queue[BusMessage]"] = None,
+		on_message: Optional[Callable[[BusMessage], None]] = None,
 	) -> MultiSubscription:
 		if not topics:
 			raise ValueError("topics must not be empty")
-		if q is None:
+		if on_message is not None:
+			if q is not None:
+				raise ValueError("on_message cannot be combined with a caller-provided queue")
+			q = _HookedQueue(on_message)
+		elif q is None:
 			q = queue.Queue()
 		subs = [self.subscribe(topic, q) for topic in topics]
 		return MultiSubscription(subs)
@@ -177,9 +229,10 @@ class WorkerBus:
 			# fnmatch is case-sensitive with fnmatchcase
 			if fnmatch.fnmatchcase(topic_str, pat):
 				targets.append(q)
-		payload_summary = self._summarize_payload(payload)
-		logger.trace(
-			f"[publish] - bus_message - topic={topic_str} source={source} source_id={source_id} targets={len(targets)} payload={payload_summary}"
+		# Lazy: the payload summary is only built when a TRACE sink is active.
+		logger.opt(lazy=True).trace(
+			"{}",
+			lambda: f"[publish] - bus_message - topic={topic_str} source={source} source_id={source_id} targets={len(targets)} payload={self._summarize_payload(payload)}",
 		)
 		for q in targets:
 			q.put(msg)